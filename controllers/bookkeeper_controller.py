@@ -36,16 +36,16 @@ class BookkeeperController(QObject):
         self.user_id = user_id
         
         # Connect view signals to controller handlers
-        self.bookkeeper_view.dashboard_requested.connect(self.handle_dashboard)
-        self.bookkeeper_view.suppliers_requested.connect(self.handle_suppliers)
-        self.bookkeeper_view.customers_requested.connect(self.handle_customers)
-        self.bookkeeper_view.products_requested.connect(self.handle_products)
-        self.bookkeeper_view.inventory_requested.connect(self.handle_inventory)
-        self.bookkeeper_view.vehicles_requested.connect(self.handle_vehicles)
-        self.bookkeeper_view.services_requested.connect(self.handle_services)
-        self.bookkeeper_view.sales_requested.connect(self.handle_sales)
-        self.bookkeeper_view.configuration_requested.connect(self.handle_configuration)
-        self.bookkeeper_view.logout_requested.connect(self.handle_logout)
+        self.bookkeeper_view.dashboard_requested.connect(self.dashboard_requested)
+        self.bookkeeper_view.suppliers_requested.connect(self.suppliers_requested)
+        self.bookkeeper_view.customers_requested.connect(self.customers_requested)
+        self.bookkeeper_view.products_requested.connect(self.products_requested)
+        self.bookkeeper_view.inventory_requested.connect(self.inventory_requested)
+        self.bookkeeper_view.vehicles_requested.connect(self.vehicles_requested)
+        self.bookkeeper_view.services_requested.connect(self.services_requested)
+        self.bookkeeper_view.sales_requested.connect(self.sales_requested)
+        self.bookkeeper_view.configuration_requested.connect(self.configuration_requested)
+        self.bookkeeper_view.logout_requested.connect(self.logout_requested)
         self.bookkeeper_view.create_account_requested.connect(self.handle_create_account)
         self.bookkeeper_view.update_account_requested.connect(self.handle_update_account)
         self.bookkeeper_view.delete_account_requested.connect(self.handle_delete_account)
@@ -197,46 +197,6 @@ class BookkeeperController(QObject):
         accounts = self.nominal_account_model.get_all(self.user_id)
         self.bookkeeper_view.load_accounts(accounts)
     
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-    
     def get_accounts_for_transfer(self):
         """Get accounts list for transfer dialog."""
         accounts = self.nominal_account_model.get_all(self.user_id)
@@ -266,4 +226,3 @@ class BookkeeperController(QObject):
         
         # Show dialog
         reports_dialog.exec()
-
@@ -22,6 +22,7 @@ class ConfigurationController(QObject):
     sales_requested = Signal()
     logout_requested = Signal()
     types_changed = Signal()  # Emitted when types are created or deleted
+    api_key_changed = Signal(str)  # Emitted with the service name when an API key is saved or cleared
     
     def __init__(
         self, 
@@ -36,16 +37,16 @@ class ConfigurationController(QObject):
         self.user_id = user_id
         
         # Connect view signals to controller handlers
-        self.configuration_view.dashboard_requested.connect(self.handle_dashboard)
-        self.configuration_view.suppliers_requested.connect(self.handle_suppliers)
-        self.configuration_view.customers_requested.connect(self.handle_customers)
-        self.configuration_view.products_requested.connect(self.handle_products)
-        self.configuration_view.inventory_requested.connect(self.handle_inventory)
-        self.configuration_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.configuration_view.vehicles_requested.connect(self.handle_vehicles)
-        self.configuration_view.services_requested.connect(self.handle_services)
-        self.configuration_view.sales_requested.connect(self.handle_sales)
-        self.configuration_view.logout_requested.connect(self.handle_logout)
+        self.configuration_view.dashboard_requested.connect(self.dashboard_requested)
+        self.configuration_view.suppliers_requested.connect(self.suppliers_requested)
+        self.configuration_view.customers_requested.connect(self.customers_requested)
+        self.configuration_view.products_requested.connect(self.products_requested)
+        self.configuration_view.inventory_requested.connect(self.inventory_requested)
+        self.configuration_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.configuration_view.vehicles_requested.connect(self.vehicles_requested)
+        self.configuration_view.services_requested.connect(self.services_requested)
+        self.configuration_view.sales_requested.connect(self.sales_requested)
+        self.configuration_view.logout_requested.connect(self.logout_requested)
         
         # Connect API key signals
         self.configuration_view.api_key_save_requested.connect(self.handle_save_api_key)
@@ -77,6 +78,8 @@ class ConfigurationController(QObject):
         if not api_key:
             # Delete the key if empty
             success, message = self.api_key_model.delete_api_key(self.user_id, service_name)
+            if success:
+                self.api_key_changed.emit(service_name)
             self.configuration_view.show_message(
                 "Success" if success else "Info",
                 "API key cleared" if success else message
@@ -86,48 +89,10 @@ class ConfigurationController(QObject):
         success, message = self.api_key_model.save_api_key(
             self.user_id, service_name, api_key
         )
+        if success:
+            self.api_key_changed.emit(service_name)
         self.configuration_view.show_message(
             "Success" if success else "Error",
             message,
             is_error=not success
         )
-    
-    def handle_dashboard(self) -> None:
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self) -> None:
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self) -> None:
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self) -> None:
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self) -> None:
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self) -> None:
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-    
-    def handle_vehicles(self) -> None:
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-    
-    def handle_services(self) -> None:
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_sales(self) -> None:
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_logout(self) -> None:
-        """Handle logout."""
-        self.logout_requested.emit()
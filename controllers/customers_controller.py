@@ -31,16 +31,16 @@ class CustomersController(QObject):
         self.user_id = user_id
         
         # Connect view signals to controller handlers
-        self.customers_view.dashboard_requested.connect(self.handle_dashboard)
-        self.customers_view.suppliers_requested.connect(self.handle_suppliers)
-        self.customers_view.products_requested.connect(self.handle_products)
-        self.customers_view.inventory_requested.connect(self.handle_inventory)
-        self.customers_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.customers_view.vehicles_requested.connect(self.handle_vehicles)
-        self.customers_view.services_requested.connect(self.handle_services)
-        self.customers_view.sales_requested.connect(self.handle_sales)
-        self.customers_view.configuration_requested.connect(self.handle_configuration)
-        self.customers_view.logout_requested.connect(self.handle_logout)
+        self.customers_view.dashboard_requested.connect(self.dashboard_requested)
+        self.customers_view.suppliers_requested.connect(self.suppliers_requested)
+        self.customers_view.products_requested.connect(self.products_requested)
+        self.customers_view.inventory_requested.connect(self.inventory_requested)
+        self.customers_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.customers_view.vehicles_requested.connect(self.vehicles_requested)
+        self.customers_view.services_requested.connect(self.services_requested)
+        self.customers_view.sales_requested.connect(self.sales_requested)
+        self.customers_view.configuration_requested.connect(self.configuration_requested)
+        self.customers_view.logout_requested.connect(self.logout_requested)
         self.customers_view.create_requested.connect(self.handle_create)
         self.customers_view.update_requested.connect(self.handle_update)
         self.customers_view.delete_requested.connect(self.handle_delete)
@@ -95,44 +95,3 @@ class CustomersController(QObject):
         """Refresh the customers list."""
         customers = self.customer_model.get_all(self.user_id)
         self.customers_view.load_customers(customers)
-    
-    def handle_dashboard(self) -> None:
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self) -> None:
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_products(self) -> None:
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self) -> None:
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self) -> None:
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-
-    def handle_vehicles(self) -> None:
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-
-    def handle_services(self) -> None:
-        """Handle services navigation."""
-        self.services_requested.emit()
-
-    def handle_sales(self) -> None:
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-
-    def handle_configuration(self) -> None:
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self) -> None:
-        """Handle logout."""
-        self.logout_requested.emit()
-
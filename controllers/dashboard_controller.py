@@ -36,62 +36,22 @@ class DashboardController(QObject):
         self.journal_entry_model = JournalEntry(db_path)
         
         # Connect view signals to controller
-        self.dashboard_view.logout_requested.connect(self.handle_logout)
-        self.dashboard_view.suppliers_requested.connect(self.handle_suppliers)
-        self.dashboard_view.customers_requested.connect(self.handle_customers)
-        self.dashboard_view.products_requested.connect(self.handle_products)
-        self.dashboard_view.inventory_requested.connect(self.handle_inventory)
-        self.dashboard_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.dashboard_view.vehicles_requested.connect(self.handle_vehicles)
-        self.dashboard_view.services_requested.connect(self.handle_services)
-        self.dashboard_view.sales_requested.connect(self.handle_sales)
-        self.dashboard_view.configuration_requested.connect(self.handle_configuration)
+        self.dashboard_view.logout_requested.connect(self.logout_requested)
+        self.dashboard_view.suppliers_requested.connect(self.suppliers_requested)
+        self.dashboard_view.customers_requested.connect(self.customers_requested)
+        self.dashboard_view.products_requested.connect(self.products_requested)
+        self.dashboard_view.inventory_requested.connect(self.inventory_requested)
+        self.dashboard_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.dashboard_view.vehicles_requested.connect(self.vehicles_requested)
+        self.dashboard_view.services_requested.connect(self.services_requested)
+        self.dashboard_view.sales_requested.connect(self.sales_requested)
+        self.dashboard_view.configuration_requested.connect(self.configuration_requested)
         self.dashboard_view.cash_up_requested.connect(self.handle_cash_up_navigation)
     
     def set_user_id(self, user_id: int):
         """Update the user ID."""
         self.user_id = user_id
     
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-    
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-    
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
     def handle_cash_up_navigation(self):
         """Handle cash up request - open cash up dialog."""
         # Import here to avoid circular imports
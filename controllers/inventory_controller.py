@@ -30,16 +30,16 @@ class InventoryController(QObject):
         self.user_id = user_id
         
         # Connect view signals to controller handlers
-        self.inventory_view.dashboard_requested.connect(self.handle_dashboard)
-        self.inventory_view.suppliers_requested.connect(self.handle_suppliers)
-        self.inventory_view.customers_requested.connect(self.handle_customers)
-        self.inventory_view.products_requested.connect(self.handle_products)
-        self.inventory_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.inventory_view.vehicles_requested.connect(self.handle_vehicles)
-        self.inventory_view.services_requested.connect(self.handle_services)
-        self.inventory_view.sales_requested.connect(self.handle_sales)
-        self.inventory_view.configuration_requested.connect(self.handle_configuration)
-        self.inventory_view.logout_requested.connect(self.handle_logout)
+        self.inventory_view.dashboard_requested.connect(self.dashboard_requested)
+        self.inventory_view.suppliers_requested.connect(self.suppliers_requested)
+        self.inventory_view.customers_requested.connect(self.customers_requested)
+        self.inventory_view.products_requested.connect(self.products_requested)
+        self.inventory_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.inventory_view.vehicles_requested.connect(self.vehicles_requested)
+        self.inventory_view.services_requested.connect(self.services_requested)
+        self.inventory_view.sales_requested.connect(self.sales_requested)
+        self.inventory_view.configuration_requested.connect(self.configuration_requested)
+        self.inventory_view.logout_requested.connect(self.logout_requested)
         self.inventory_view.filter_changed.connect(self.handle_filter_changed)
         
         # Load initial inventory
@@ -61,44 +61,3 @@ class InventoryController(QObject):
     def handle_filter_changed(self, show_out_of_stock: bool):
         """Handle filter checkbox state change."""
         self.refresh_inventory()
-    
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-
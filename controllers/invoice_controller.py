@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Optional
 from PySide6.QtCore import QObject, Signal
 from datetime import datetime
 from utils.transaction_logger import TransactionLogger
+from utils.vat import normalize_vat_code
 from utils.account_finder import (
     find_trade_creditors_account,
     find_stock_asset_account,
@@ -286,7 +287,7 @@ class InvoiceController(QObject):
                 except Exception:
                     vat_code = 'S'
             
-            vat_code = (vat_code or 'S').strip().upper()
+            vat_code = normalize_vat_code(vat_code)
             
             # Calculate amount (excluding VAT - we log the net amount)
             amount = quantity * unit_price
@@ -35,16 +35,16 @@ class ProductsController(QObject):
         self.user_id = user_id
         
         # Connect view signals to controller handlers
-        self.products_view.dashboard_requested.connect(self.handle_dashboard)
-        self.products_view.suppliers_requested.connect(self.handle_suppliers)
-        self.products_view.customers_requested.connect(self.handle_customers)
-        self.products_view.inventory_requested.connect(self.handle_inventory)
-        self.products_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.products_view.vehicles_requested.connect(self.handle_vehicles)
-        self.products_view.services_requested.connect(self.handle_services)
-        self.products_view.sales_requested.connect(self.handle_sales)
-        self.products_view.configuration_requested.connect(self.handle_configuration)
-        self.products_view.logout_requested.connect(self.handle_logout)
+        self.products_view.dashboard_requested.connect(self.dashboard_requested)
+        self.products_view.suppliers_requested.connect(self.suppliers_requested)
+        self.products_view.customers_requested.connect(self.customers_requested)
+        self.products_view.inventory_requested.connect(self.inventory_requested)
+        self.products_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.products_view.vehicles_requested.connect(self.vehicles_requested)
+        self.products_view.services_requested.connect(self.services_requested)
+        self.products_view.sales_requested.connect(self.sales_requested)
+        self.products_view.configuration_requested.connect(self.configuration_requested)
+        self.products_view.logout_requested.connect(self.logout_requested)
         self.products_view.create_requested.connect(self.handle_create)
         self.products_view.create_tyre_requested.connect(self.handle_create_tyre)
         self.products_view.update_requested.connect(self.handle_update)
@@ -315,46 +315,6 @@ class ProductsController(QObject):
             # Show error message
             self.products_view.show_error_dialog(message)
     
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-    
     def handle_catalogue(self):
         """Handle catalogue view request."""
         from views.tyre_catalogue_view import TyreCatalogueView
@@ -400,4 +360,3 @@ class ProductsController(QObject):
             return False
         
         return self.product_model.has_history(internal_id)
-
@@ -40,17 +40,17 @@ class ReportsController(QObject):
         
         # Connect view signals to controller handlers (only if they exist - dialogs don't have navigation signals)
         if hasattr(self.reports_view, 'dashboard_requested'):
-            self.reports_view.dashboard_requested.connect(self.handle_dashboard)
-            self.reports_view.suppliers_requested.connect(self.handle_suppliers)
-            self.reports_view.customers_requested.connect(self.handle_customers)
-            self.reports_view.products_requested.connect(self.handle_products)
-            self.reports_view.inventory_requested.connect(self.handle_inventory)
-            self.reports_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-            self.reports_view.vehicles_requested.connect(self.handle_vehicles)
-            self.reports_view.services_requested.connect(self.handle_services)
-            self.reports_view.sales_requested.connect(self.handle_sales)
-            self.reports_view.configuration_requested.connect(self.handle_configuration)
-            self.reports_view.logout_requested.connect(self.handle_logout)
+            self.reports_view.dashboard_requested.connect(self.dashboard_requested)
+            self.reports_view.suppliers_requested.connect(self.suppliers_requested)
+            self.reports_view.customers_requested.connect(self.customers_requested)
+            self.reports_view.products_requested.connect(self.products_requested)
+            self.reports_view.inventory_requested.connect(self.inventory_requested)
+            self.reports_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+            self.reports_view.vehicles_requested.connect(self.vehicles_requested)
+            self.reports_view.services_requested.connect(self.services_requested)
+            self.reports_view.sales_requested.connect(self.sales_requested)
+            self.reports_view.configuration_requested.connect(self.configuration_requested)
+            self.reports_view.logout_requested.connect(self.logout_requested)
         
         # Report generation signals (always present)
         self.reports_view.generate_vat_return_requested.connect(self.handle_generate_vat_return)
@@ -583,48 +583,3 @@ class ReportsController(QObject):
                 return balance
         except Exception:
             return opening_balance
-    
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-    
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-    
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-
@@ -1,8 +1,10 @@
 """Sales controller."""
+import sqlite3
 from typing import TYPE_CHECKING, Optional, List, Dict
 from PySide6.QtCore import QObject, Signal
 from datetime import datetime
 from utils.transaction_logger import TransactionLogger
+from utils.vat import normalize_vat_code
 from utils.account_finder import (
     find_trade_debtors_account,
     find_sales_account,
@@ -25,6 +27,9 @@ if TYPE_CHECKING:
     from models.vehicle import Vehicle
 
 
+_CUSTOMER_NAME_SQL = "SELECT name FROM customers WHERE id = ? AND user_id = ?"
+
+
 class SalesController(QObject):
     """Controller for sales functionality."""
     
@@ -73,18 +78,20 @@ class SalesController(QObject):
         self.vehicle_model = vehicle_model
         self.user_id = user_id
         self.transaction_logger = TransactionLogger(sales_invoice_model.db_path)
+        # Long-lived connection so repeated lookups reuse SQLite's prepared statements
+        self._conn = sqlite3.connect(sales_invoice_model.db_path, cached_statements=256, timeout=10.0)
         
         # Connect view signals to controller handlers
-        self.sales_view.dashboard_requested.connect(self.handle_dashboard)
-        self.sales_view.suppliers_requested.connect(self.handle_suppliers)
-        self.sales_view.customers_requested.connect(self.handle_customers)
-        self.sales_view.products_requested.connect(self.handle_products)
-        self.sales_view.inventory_requested.connect(self.handle_inventory)
-        self.sales_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.sales_view.vehicles_requested.connect(self.handle_vehicles)
-        self.sales_view.services_requested.connect(self.handle_services)
-        self.sales_view.configuration_requested.connect(self.handle_configuration)
-        self.sales_view.logout_requested.connect(self.handle_logout)
+        self.sales_view.dashboard_requested.connect(self.dashboard_requested)
+        self.sales_view.suppliers_requested.connect(self.suppliers_requested)
+        self.sales_view.customers_requested.connect(self.customers_requested)
+        self.sales_view.products_requested.connect(self.products_requested)
+        self.sales_view.inventory_requested.connect(self.inventory_requested)
+        self.sales_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.sales_view.vehicles_requested.connect(self.vehicles_requested)
+        self.sales_view.services_requested.connect(self.services_requested)
+        self.sales_view.configuration_requested.connect(self.configuration_requested)
+        self.sales_view.logout_requested.connect(self.logout_requested)
         
         # Sales document signals
         self.sales_view.create_document_requested.connect(self.handle_create_document)
@@ -578,45 +585,21 @@ class SalesController(QObject):
         services = self.service_model.get_all(self.user_id)
         self.sales_view.load_services(services)
     
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-    
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-    
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
+    def _get_customer_name(self, customer_id: int) -> str:
+        """
+        Get a customer's name by internal ID for journal descriptions.
+        
+        Args:
+            customer_id: Internal customer ID
+        
+        Returns:
+            Customer name, or 'Unknown Customer' if it cannot be found
+        """
+        try:
+            row = self._conn.execute(_CUSTOMER_NAME_SQL, (customer_id, self.user_id)).fetchone()
+        except sqlite3.Error:
+            return 'Unknown Customer'
+        return row[0] if row else 'Unknown Customer'
     
     def _log_sales_invoice_item_transaction(self, sales_invoice_id: int, product_id: Optional[int],
                                            service_id: Optional[int], description: str,
@@ -655,23 +638,11 @@ class SalesController(QObject):
                 invoice_date = datetime.now().date()
             
             # Get customer name
-            import sqlite3
-            customer_name = 'Unknown Customer'
-            try:
-                with sqlite3.connect(self.sales_invoice_model.db_path, timeout=10.0) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT name FROM customers WHERE id = ? AND user_id = ?", (customer_id, self.user_id))
-                    row = cursor.fetchone()
-                    if row:
-                        customer_name = row[0]
-            except Exception:
-                pass
+            customer_name = self._get_customer_name(customer_id)
             
             # Get VAT code from item if not provided and item_id is available
             if not vat_code and item_id:
                 try:
-                    import sqlite3
                     with sqlite3.connect(self.sales_invoice_model.db_path, timeout=10.0) as conn:
                         cursor = conn.cursor()
                         cursor.execute("SELECT vat_code FROM sales_invoice_items WHERE id = ?", (item_id,))
@@ -681,7 +652,7 @@ class SalesController(QObject):
                 except Exception:
                     vat_code = 'S'
             
-            vat_code = (vat_code or 'S').strip().upper()
+            vat_code = normalize_vat_code(vat_code)
             
             # Calculate amount (excluding VAT - we log the net amount)
             amount = quantity * unit_price
@@ -789,18 +760,7 @@ class SalesController(QObject):
                 payment_date_obj = datetime.now().date()
             
             # Get customer name
-            import sqlite3
-            customer_name = 'Unknown Customer'
-            try:
-                with sqlite3.connect(self.sales_invoice_model.db_path, timeout=10.0) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT name FROM customers WHERE id = ? AND user_id = ?", (customer_id, self.user_id))
-                    row = cursor.fetchone()
-                    if row:
-                        customer_name = row[0]
-            except Exception:
-                pass
+            customer_name = self._get_customer_name(customer_id)
             
             # Find Trade Debtors account
             debtor_account_id = find_trade_debtors_account(self.user_id, self.sales_invoice_model.db_path)
@@ -832,4 +792,3 @@ class SalesController(QObject):
         except Exception as e:
             # Don't fail the payment creation if logging fails
             pass
-
@@ -41,16 +41,16 @@ class ServicesController(QObject):
         self.services_view.set_models(self.nominal_account_model, self.user_id)
         
         # Connect view signals to controller handlers
-        self.services_view.dashboard_requested.connect(self.handle_dashboard)
-        self.services_view.suppliers_requested.connect(self.handle_suppliers)
-        self.services_view.customers_requested.connect(self.handle_customers)
-        self.services_view.products_requested.connect(self.handle_products)
-        self.services_view.inventory_requested.connect(self.handle_inventory)
-        self.services_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.services_view.vehicles_requested.connect(self.handle_vehicles)
-        self.services_view.sales_requested.connect(self.handle_sales)
-        self.services_view.configuration_requested.connect(self.handle_configuration)
-        self.services_view.logout_requested.connect(self.handle_logout)
+        self.services_view.dashboard_requested.connect(self.dashboard_requested)
+        self.services_view.suppliers_requested.connect(self.suppliers_requested)
+        self.services_view.customers_requested.connect(self.customers_requested)
+        self.services_view.products_requested.connect(self.products_requested)
+        self.services_view.inventory_requested.connect(self.inventory_requested)
+        self.services_view.bookkeeper_requested.connect(self.bookkeeper_requested)
+        self.services_view.vehicles_requested.connect(self.vehicles_requested)
+        self.services_view.sales_requested.connect(self.sales_requested)
+        self.services_view.configuration_requested.connect(self.configuration_requested)
+        self.services_view.logout_requested.connect(self.logout_requested)
         self.services_view.create_requested.connect(self.handle_create)
         self.services_view.update_requested.connect(self.handle_update)
         self.services_view.delete_requested.connect(self.handle_delete)
@@ -154,44 +154,3 @@ class ServicesController(QObject):
         service = self.service_model.get_by_id(service_id, self.user_id)
         if service:
             self.services_view.show_service_details(service)
-    
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_suppliers(self):
-        """Handle suppliers navigation."""
-        self.suppliers_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-    
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-    
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
-
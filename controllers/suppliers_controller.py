@@ -1,6 +1,7 @@
 """Suppliers controller."""
+import time
 from typing import TYPE_CHECKING, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
 
 if TYPE_CHECKING:
     from views.suppliers_view import SuppliersView
@@ -14,17 +15,22 @@ class SuppliersController(QObject):
     """Controller for suppliers functionality."""
     
     # Signals
-    dashboard_requested = Signal()
-    customers_requested = Signal()
-    products_requested = Signal()
-    inventory_requested = Signal()
-    bookkeeper_requested = Signal()
-    vehicles_requested = Signal()
-    services_requested = Signal()
-    sales_requested = Signal()
-    configuration_requested = Signal()
-    logout_requested = Signal()
-    balance_changed = Signal()  # Emitted when invoices/payments change
+    # Navigation signals are emitted directly by SuppliersView; the application
+    # connects to suppliers_view.*_requested rather than relaying them here.
+    balance_changed = Signal()  # Derived: emitted once invoices/payments have changed balances
+    
+    # Seconds a fetched supplier list is reused before hitting the database again
+    _SUPPLIER_TTL = 2.0
+    # Milliseconds to wait for a burst of invoice/payment signals to settle
+    _REFRESH_DEBOUNCE_MS = 50
+    # Supplier view tab indices that depend on invoice/payment data
+    _INVOICES_TAB = 2
+    _PAYMENTS_TAB = 3
+    # Invoice/payment controller signals that affect supplier balances
+    _INVOICE_SIGNALS = ("invoice_created", "invoice_updated", "invoice_deleted",
+                        "item_added", "item_updated", "item_deleted")
+    _PAYMENT_SIGNALS = ("payment_created", "payment_deleted", "allocation_created",
+                        "allocation_updated", "allocation_deleted")
     
     def __init__(self, suppliers_view: "SuppliersView", supplier_model: "Supplier", user_id: int,
                  invoice_controller: Optional["InvoiceController"] = None,
@@ -40,45 +46,42 @@ class SuppliersController(QObject):
         self.payment_controller = payment_controller
         self.product_model = product_model
         self.tyre_model = tyre_model
+        # Supplier lists keyed by user_id: (fetched_at, suppliers)
+        self._suppliers_cache: dict[int, tuple[float, list]] = {}
+        # Hash of the rows last passed to the view, to skip identical reloads
+        self._last_load_hash: Optional[int] = None
+        self._refreshing = False  # Guards refresh_suppliers against re-entry
+        
+        # Track the visible tab via currentChanged instead of querying it on each refresh
+        self._tab_widget = getattr(self.suppliers_view, "tab_widget", None)
+        self._current_tab = -1
+        if self._tab_widget is not None:
+            self._current_tab = self._tab_widget.currentIndex()
+            self._tab_widget.currentChanged.connect(self._on_tab_changed)
+        
+        # Coalesce bursts of invoice/payment signals into a single refresh
+        self._pending_tabs = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self._REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         
         # Connect view signals to controller handlers
-        self.suppliers_view.dashboard_requested.connect(self.handle_dashboard)
-        self.suppliers_view.customers_requested.connect(self.handle_customers)
-        self.suppliers_view.products_requested.connect(self.handle_products)
-        self.suppliers_view.inventory_requested.connect(self.handle_inventory)
-        self.suppliers_view.bookkeeper_requested.connect(self.handle_bookkeeper)
-        self.suppliers_view.vehicles_requested.connect(self.handle_vehicles)
-        self.suppliers_view.services_requested.connect(self.handle_services)
-        self.suppliers_view.sales_requested.connect(self.handle_sales)
-        self.suppliers_view.configuration_requested.connect(self.handle_configuration)
-        self.suppliers_view.logout_requested.connect(self.handle_logout)
-        self.suppliers_view.create_requested.connect(self.handle_create)
-        self.suppliers_view.update_requested.connect(self.handle_update)
-        self.suppliers_view.delete_requested.connect(self.handle_delete)
-        self.suppliers_view.refresh_requested.connect(self.refresh_suppliers)
+        for sig_name, slot in (("create_requested", self.handle_create),
+                               ("update_requested", self.handle_update),
+                               ("delete_requested", self.handle_delete),
+                               ("refresh_requested", self._on_refresh_requested)):
+            getattr(self.suppliers_view, sig_name).connect(slot, Qt.ConnectionType.UniqueConnection)
         
         # Connect invoice/payment signals to refresh balances
         if self.invoice_controller:
-            self.invoice_controller.invoice_created.connect(self._on_invoice_change)
-            self.invoice_controller.invoice_updated.connect(self._on_invoice_change)
-            self.invoice_controller.invoice_deleted.connect(self._on_invoice_change)
-            self.invoice_controller.item_added.connect(self._on_invoice_change)
-            self.invoice_controller.item_updated.connect(self._on_invoice_change)
-            self.invoice_controller.item_deleted.connect(self._on_invoice_change)
-        
+            self._wire_invoice_signals(self.invoice_controller)
         if self.payment_controller:
-            self.payment_controller.payment_created.connect(self._on_payment_change)
-            self.payment_controller.payment_deleted.connect(self._on_payment_change)
-            self.payment_controller.allocation_created.connect(self._on_payment_change)
-            self.payment_controller.allocation_updated.connect(self._on_payment_change)
-            self.payment_controller.allocation_deleted.connect(self._on_payment_change)
+            self._wire_payment_signals(self.payment_controller)
         
         # Set controllers in view
-        if self.invoice_controller and self.payment_controller:
-            self.suppliers_view.set_controllers(
-                self.invoice_controller, self.payment_controller, self.supplier_model, self.user_id,
-                self.product_model, self.tyre_model
-            )
+        self._wired_ctrls: Optional[tuple] = None
+        self._bind_view_controllers()
         
         # Load initial suppliers
         self.refresh_suppliers()
@@ -90,105 +93,153 @@ class SuppliersController(QObject):
             self.invoice_controller.set_user_id(user_id)
         if self.payment_controller:
             self.payment_controller.set_user_id(user_id)
-        if self.invoice_controller and self.payment_controller:
-            self.suppliers_view.set_controllers(
-                self.invoice_controller, self.payment_controller, self.supplier_model, self.user_id,
-                self.product_model, self.tyre_model
-            )
+        self._bind_view_controllers()
+        self.invalidate_suppliers_cache()
+        self._last_load_hash = None
         self.refresh_suppliers()
     
-    def _on_invoice_change(self):
-        """Handle invoice changes - refresh suppliers to update balances and invoices tab."""
+    def _wire_invoice_signals(self, invoice_controller: "InvoiceController") -> None:
+        """Connect invoice change signals to the balance refresh (at most once each)."""
+        for name in self._INVOICE_SIGNALS:
+            getattr(invoice_controller, name).connect(
+                self._on_invoice_change, Qt.ConnectionType.UniqueConnection)
+    
+    def _wire_payment_signals(self, payment_controller: "PaymentController") -> None:
+        """Connect payment change signals to the balance refresh (at most once each)."""
+        for name in self._PAYMENT_SIGNALS:
+            getattr(payment_controller, name).connect(
+                self._on_payment_change, Qt.ConnectionType.UniqueConnection)
+    
+    def _bind_view_controllers(self) -> None:
+        """Pass controllers to the view, only re-binding when they have actually changed."""
+        if not (self.invoice_controller and self.payment_controller):
+            return
+        ctrls = (self.invoice_controller, self.payment_controller)
+        if self._wired_ctrls == ctrls:
+            self.suppliers_view.set_user_id(self.user_id)
+            return
+        self.suppliers_view.set_controllers(
+            self.invoice_controller, self.payment_controller, self.supplier_model, self.user_id,
+            self.product_model, self.tyre_model
+        )
+        self._wired_ctrls = ctrls
+    
+    def invalidate_suppliers_cache(self) -> None:
+        """Drop the cached supplier list so the next refresh reads from the database."""
+        self._suppliers_cache.pop(self.user_id, None)
+    
+    @Slot()
+    def _on_refresh_requested(self):
+        """Handle the Refresh button - always reload from the database."""
+        self.invalidate_suppliers_cache()
+        # Balances are not part of the hash, so an explicit refresh must not be skipped
+        self._last_load_hash = None
         self.refresh_suppliers()
-        # Refresh invoices tab if it's currently visible and a supplier is selected
-        if hasattr(self.suppliers_view, 'tab_widget'):
-            if self.suppliers_view.tab_widget.currentIndex() == 2:  # Invoices tab
-                self.suppliers_view._refresh_invoices_tab()
-        self.balance_changed.emit()
     
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Remember the visible supplier tab."""
+        self._current_tab = index
+    
+    @Slot()
+    def _on_invoice_change(self):
+        """Handle invoice changes - schedule a refresh of balances and the invoices tab."""
+        self._pending_tabs |= 1 << self._INVOICES_TAB
+        self._refresh_timer.start()
+    
+    @Slot()
     def _on_payment_change(self):
-        """Handle payment changes - refresh suppliers to update balances and payments tab."""
+        """Handle payment changes - schedule a refresh of balances and the payments tab."""
+        self._pending_tabs |= 1 << self._PAYMENTS_TAB
+        self._refresh_timer.start()
+    
+    @Slot()
+    def _do_refresh(self):
+        """Run one refresh for all invoice/payment changes since the last one."""
+        pending_tabs = self._pending_tabs
+        self._pending_tabs = 0
+        self.invalidate_suppliers_cache()
+        # Balances are rendered by the view, not part of the rows - always reload
+        self._last_load_hash = None
         self.refresh_suppliers()
-        # Refresh payments tab if it's currently visible and a supplier is selected
-        if hasattr(self.suppliers_view, 'tab_widget'):
-            if self.suppliers_view.tab_widget.currentIndex() == 3:  # Payments tab
-                self.suppliers_view._refresh_payments_tab()
+        # Refresh the invoices/payments tab if it's currently visible and was affected
+        current_tab = self._current_tab
+        if current_tab == self._INVOICES_TAB and pending_tabs & (1 << self._INVOICES_TAB):
+            self.suppliers_view._refresh_invoices_tab()
+        elif current_tab == self._PAYMENTS_TAB and pending_tabs & (1 << self._PAYMENTS_TAB):
+            self.suppliers_view._refresh_payments_tab()
         self.balance_changed.emit()
     
+    @Slot(str, str)
     def handle_create(self, account_number: str, name: str):
         """Handle create supplier."""
         success, message = self.supplier_model.create(account_number, name, self.user_id)
         
         if success:
             self.suppliers_view.show_success_dialog(message)
-            self.refresh_suppliers()
+            # Add just the new row; fall back to a full reload if it can't be read back
+            supplier = self.supplier_model.get_by_account_number(account_number, self.user_id)
+            self._apply_row_change(self.suppliers_view.insert_supplier_row, supplier)
         else:
             self.suppliers_view.show_error_dialog(message)
     
+    @Slot(int, str, str)
     def handle_update(self, supplier_id: int, account_number: str, name: str):
         """Handle update supplier."""
         success, message = self.supplier_model.update(supplier_id, account_number, name, self.user_id)
         
         if success:
             self.suppliers_view.show_success_dialog(message)
-            self.refresh_suppliers()
+            supplier = self.supplier_model.get_by_id(supplier_id, self.user_id)
+            self._apply_row_change(self.suppliers_view.update_supplier_row, supplier)
         else:
             self.suppliers_view.show_error_dialog(message)
     
+    @Slot(int)
     def handle_delete(self, supplier_id: int):
         """Handle delete supplier."""
         success, message = self.supplier_model.delete(supplier_id, self.user_id)
         
         if success:
             self.suppliers_view.show_success_dialog(message)
+            # Deleting renumbers the remaining suppliers, so every row may change
+            self.invalidate_suppliers_cache()
             self.refresh_suppliers()
         else:
             self.suppliers_view.show_error_dialog(message)
     
+    def _apply_row_change(self, apply_row, supplier: Optional[dict]):
+        """Apply a single-row change to the view, or reload everything if the row is missing."""
+        self.invalidate_suppliers_cache()
+        # The view's rows no longer match the last full load
+        self._last_load_hash = None
+        if supplier is None:
+            self.refresh_suppliers()
+        else:
+            apply_row(supplier)
+    
+    @Slot()
     def refresh_suppliers(self):
-        """Refresh the suppliers list."""
-        suppliers = self.supplier_model.get_all(self.user_id)
-        self.suppliers_view.load_suppliers(suppliers)
+        """Refresh the suppliers list, reusing a recently fetched list when available."""
+        # Loading the table emits view signals; never start a refresh from inside one
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            cached = self._suppliers_cache.get(self.user_id)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self._SUPPLIER_TTL:
+                suppliers = cached[1]
+            else:
+                suppliers = self.supplier_model.get_all(self.user_id)
+                self._suppliers_cache[self.user_id] = (now, suppliers)
+            new_hash = hash(tuple((s['id'], s['account_number'], s['name']) for s in suppliers))
+            if new_hash == self._last_load_hash:
+                return
+            self._last_load_hash = new_hash
+            self.suppliers_view.load_suppliers(suppliers)
+        finally:
+            self._refreshing = False
         
         # Note: Invoices and payments are now supplier-specific and will be refreshed
         # when a supplier is selected or when switching to those tabs
-    
-    def handle_dashboard(self):
-        """Handle dashboard navigation."""
-        self.dashboard_requested.emit()
-    
-    def handle_customers(self):
-        """Handle customers navigation."""
-        self.customers_requested.emit()
-    
-    def handle_products(self):
-        """Handle products navigation."""
-        self.products_requested.emit()
-    
-    def handle_inventory(self):
-        """Handle inventory navigation."""
-        self.inventory_requested.emit()
-    
-    def handle_bookkeeper(self):
-        """Handle bookkeeper navigation."""
-        self.bookkeeper_requested.emit()
-
-    def handle_vehicles(self):
-        """Handle vehicles navigation."""
-        self.vehicles_requested.emit()
-
-    def handle_services(self):
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_sales(self):
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_configuration(self):
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self):
-        """Handle logout."""
-        self.logout_requested.emit()
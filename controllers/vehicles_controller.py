@@ -1,28 +1,67 @@
 """Vehicles controller."""
-import requests
+import json
+import urllib3
+from urllib3.exceptions import HTTPError, MaxRetryError, TimeoutError as Urllib3Timeout
+from urllib3.util.retry import Retry
 from typing import TYPE_CHECKING, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, Slot
 
 if TYPE_CHECKING:
     from views.vehicles_view import VehiclesView
     from models.vehicle import Vehicle
     from models.api_key import ApiKey
 
+# Unreachable hosts fail fast, slow responses still complete
+API_TIMEOUT = urllib3.Timeout(connect=3.05, read=15)
+
+
+class VehicleLookupWorker(QObject):
+    """Worker that performs a UK Vehicle Data API request off the GUI thread."""
+    
+    finished = Signal(object, str, int)  # response data, vrm, session
+    failed = Signal(str, int)  # user-facing error message, session
+    
+    def __init__(self, http: urllib3.PoolManager, url: str, fields: dict, vrm: str, session: int):
+        """Initialize the worker with the request to perform."""
+        super().__init__()
+        self.http = http
+        self.url = url
+        self.fields = fields
+        self.vrm = vrm
+        self.session = session
+    
+    @Slot()
+    def run(self) -> None:
+        """Perform the request and emit the decoded JSON or an error message."""
+        try:
+            response = self.http.request("GET", self.url, fields=self.fields, timeout=API_TIMEOUT)
+            if response.status >= 400:
+                self.failed.emit(f"API request failed: HTTP {response.status}", self.session)
+                return
+            data = json.loads(response.data)
+        except Urllib3Timeout:
+            self.failed.emit("The vehicle data API is unreachable. Please try again later.", self.session)
+            return
+        except MaxRetryError as e:
+            if isinstance(e.reason, Urllib3Timeout):
+                self.failed.emit("The vehicle data API is unreachable. Please try again later.", self.session)
+            else:
+                self.failed.emit(f"API request failed: {str(e.reason)}", self.session)
+            return
+        except HTTPError as e:
+            self.failed.emit(f"API request failed: {str(e)}", self.session)
+            return
+        except ValueError:
+            self.failed.emit("API returned an invalid response", self.session)
+            return
+        self.finished.emit(data, self.vrm, self.session)
+
 
 class VehiclesController(QObject):
     """Controller for vehicles functionality."""
     
-    # Navigation signals
-    dashboard_requested = Signal()
-    suppliers_requested = Signal()
-    customers_requested = Signal()
-    products_requested = Signal()
-    inventory_requested = Signal()
-    bookkeeper_requested = Signal()
-    services_requested = Signal()
-    sales_requested = Signal()
-    configuration_requested = Signal()
-    logout_requested = Signal()
+    # Navigation signals are emitted directly by VehiclesView; the application
+    # connects to vehicles_view.*_requested rather than relaying them here.
     
     UK_VEHICLE_DATA_URL = "https://legacy.api.vehicledataglobal.com/api/datapackage/TyreData"
     
@@ -39,38 +78,67 @@ class VehiclesController(QObject):
         self.vehicle_model = vehicle_model
         self.api_key_model = api_key_model
         self.user_id = user_id
+        self._lookup_thread: Optional[QThread] = None
+        self._lookup_worker: Optional[VehicleLookupWorker] = None
+        # Bumped on every user change/logout; lookups from an older session are ignored
+        self._session = 0
+        self._refreshing = False  # Guards refresh_vehicles against re-entry
+        # API keys for the current user keyed by service name
+        self._api_key_cache: dict[str, str] = {}
         
-        # Connect view navigation signals
-        self.vehicles_view.dashboard_requested.connect(self.dashboard_requested.emit)
-        self.vehicles_view.suppliers_requested.connect(self.suppliers_requested.emit)
-        self.vehicles_view.customers_requested.connect(self.customers_requested.emit)
-        self.vehicles_view.products_requested.connect(self.products_requested.emit)
-        self.vehicles_view.inventory_requested.connect(self.inventory_requested.emit)
-        self.vehicles_view.bookkeeper_requested.connect(self.bookkeeper_requested.emit)
-        self.vehicles_view.services_requested.connect(self.handle_services)
-        self.vehicles_view.sales_requested.connect(self.handle_sales)
-        self.vehicles_view.configuration_requested.connect(self.handle_configuration)
-        self.vehicles_view.logout_requested.connect(self.handle_logout)
+        # Persistent connection pool so repeated lookups reuse the TLS connection
+        # At most one reconnect attempt so a dead host fails within a few seconds;
+        # read timeouts are not retried since the request may already have been billed
+        retry = Retry(total=2, connect=1, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        self._http = urllib3.PoolManager(
+            num_pools=1, maxsize=4, retries=retry, headers={"User-Agent": "gui-app/1.0"}
+        )
         
         # Connect view action signals
         self.vehicles_view.vehicle_lookup_requested.connect(self.handle_vehicle_lookup)
         self.vehicles_view.vehicle_api_lookup_requested.connect(self.handle_api_lookup)
         self.vehicles_view.vehicle_selected.connect(self.handle_vehicle_selected)
         self.vehicles_view.vehicle_delete_requested.connect(self.handle_vehicle_delete)
+        # A QThread destroyed while still running aborts the process
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown)
     
     def set_user_id(self, user_id: int) -> None:
         """Set the current user ID."""
         self.user_id = user_id
+        self._session += 1
+        self._api_key_cache.clear()
         self.refresh_vehicles()
     
+    @Slot()
+    def shutdown(self) -> None:
+        """End the session: stop any running lookup and close pooled HTTP connections."""
+        self.user_id = None
+        self._session += 1
+        self._api_key_cache.clear()
+        thread = self._lookup_thread
+        if thread is not None:
+            # The request itself can't be interrupted; wait for it so the thread
+            # is not destroyed while running. Its result is dropped as stale.
+            thread.finished.disconnect(self._on_lookup_thread_finished)
+            thread.quit()
+            thread.wait()
+            self._on_lookup_thread_finished()
+        # Connections are re-opened on the next lookup
+        self._http.clear()
+    
     def refresh_vehicles(self) -> None:
         """Clear the vehicles list and focus VRM input."""
-        if self.user_id is None:
+        if self.user_id is None or self._refreshing:
             return
-        # Clear the table - don't show any vehicles until a search is performed
-        self.vehicles_view.populate_vehicles([])
-        self.vehicles_view.focus_vrm_input()
+        self._refreshing = True
+        try:
+            # Clear the table - don't show any vehicles until a search is performed
+            self.vehicles_view.populate_vehicles([])
+            self.vehicles_view.focus_vrm_input()
+        finally:
+            self._refreshing = False
     
+    @Slot(str)
     def handle_vehicle_lookup(self, vrm: str) -> None:
         """Handle vehicle search request - search database for partial VRM matches."""
         if self.user_id is None:
@@ -99,6 +167,7 @@ class VehiclesController(QObject):
         # Populate table with search results
         self.vehicles_view.populate_vehicles(vehicles)
     
+    @Slot(str)
     def handle_api_lookup(self, vrm: str) -> None:
         """Handle external API lookup request for a VRM."""
         if self.user_id is None:
@@ -116,7 +185,7 @@ class VehiclesController(QObject):
                 return
         
         # Get API key
-        api_key = self.api_key_model.get_api_key(self.user_id, "uk_vehicle_data")
+        api_key = self._get_api_key("uk_vehicle_data")
         if not api_key:
             self.vehicles_view.show_message(
                 "Error", 
@@ -125,65 +194,116 @@ class VehiclesController(QObject):
             )
             return
         
-        # Make API request
-        try:
-            params = {"v": 2, "api_nullitems": 1, "key_vrm": vrm, "auth_apikey": api_key}
-            response = requests.get(self.UK_VEHICLE_DATA_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Check response status
-            status = data.get("Response", {}).get("StatusCode", "")
-            if status != "Success":
-                message = data.get("Response", {}).get("StatusMessage", "Lookup failed")
-                self.vehicles_view.show_message("Lookup Failed", message, is_error=True)
-                return
-            
-            # Extract vehicle details
-            vehicle_details = data.get("Response", {}).get("DataItems", {}).get(
-                "VehicleDetails", {}
-            )
-            tyre_details = data.get("Response", {}).get("DataItems", {}).get(
-                "TyreDetails", {}
-            )
-            
-            # Save vehicle
-            success, message, vehicle_id = self.vehicle_model.save_vehicle(
-                user_id=self.user_id,
-                vrm=vrm,
-                make=vehicle_details.get("Make", ""),
-                model=vehicle_details.get("Model", ""),
-                build_year=vehicle_details.get("BuildYear", ""),
-                tyre_data=tyre_details,
-                raw_response=data
-            )
-            
-            if success:
-                self.vehicles_view.show_message("Success", f"Vehicle {vrm} saved")
-                self.vehicles_view.clear_vrm_input()
-                self.refresh_vehicles()
-            else:
-                self.vehicles_view.show_message("Error", message, is_error=True)
-                
-        except requests.RequestException as e:
+        if self._lookup_thread is not None:
             self.vehicles_view.show_message(
-                "Error", f"API request failed: {str(e)}", is_error=True
+                "Lookup In Progress", "Please wait for the current API lookup to finish.", is_error=False
             )
+            return
+        
+        # Make API request on a worker thread so the UI stays responsive
+        fields = {"v": "2", "api_nullitems": "1", "key_vrm": vrm, "auth_apikey": api_key}
+        thread = QThread(self)
+        worker = VehicleLookupWorker(self._http, self.UK_VEHICLE_DATA_URL, fields, vrm, self._session)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_api_success)
+        worker.failed.connect(self._on_api_error)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_lookup_thread_finished)
+        self._lookup_thread = thread
+        self._lookup_worker = worker
+        self.vehicles_view.set_lookup_busy(True)
+        thread.start()
     
+    def _get_api_key(self, service_name: str) -> Optional[str]:
+        """Get an API key for the current user, reading the database only on first use."""
+        api_key = self._api_key_cache.get(service_name)
+        if api_key is None:
+            api_key = self.api_key_model.get_api_key(self.user_id, service_name)
+            if api_key:
+                self._api_key_cache[service_name] = api_key
+        return api_key
+    
+    def invalidate_api_key_cache(self, service_name: str) -> None:
+        """Forget a cached API key so the next lookup re-reads it (e.g. after Configuration saves it)."""
+        self._api_key_cache.pop(service_name, None)
+    
+    @Slot(object, str, int)
+    def _on_api_success(self, data: dict, vrm: str, session: int) -> None:
+        """Handle a completed API lookup by saving the returned vehicle."""
+        # Drop results for a user who has since logged out or been switched
+        if self.user_id is None or session != self._session:
+            return
+        
+        # Resolve the nested response sections once; a missing section means a malformed payload
+        try:
+            response = data["Response"]
+            success = response.get("StatusCode", "") == "Success"
+            data_items = response["DataItems"] if success else None
+        except (KeyError, TypeError, AttributeError):
+            self.vehicles_view.show_message("Lookup Failed", "Malformed API response", is_error=True)
+            return
+        if not success:
+            message = response.get("StatusMessage", "Lookup failed")
+            self.vehicles_view.show_message("Lookup Failed", message, is_error=True)
+            return
+        
+        # Extract vehicle details
+        data_items = data_items or {}
+        vehicle_details = data_items.get("VehicleDetails") or {}
+        tyre_details = data_items.get("TyreDetails") or {}
+        
+        # Save vehicle
+        success, message, vehicle_id = self.vehicle_model.save_vehicle(
+            user_id=self.user_id,
+            vrm=vrm,
+            make=vehicle_details.get("Make", ""),
+            model=vehicle_details.get("Model", ""),
+            build_year=vehicle_details.get("BuildYear", ""),
+            tyre_data=tyre_details,
+            raw_response=data
+        )
+        
+        if success:
+            self.vehicles_view.show_message("Success", f"Vehicle {vrm} saved")
+            self.vehicles_view.clear_vrm_input()
+            self.refresh_vehicles()
+        else:
+            self.vehicles_view.show_message("Error", message, is_error=True)
+    
+    @Slot(str, int)
+    def _on_api_error(self, message: str, session: int) -> None:
+        """Handle a failed API lookup."""
+        if session != self._session:
+            return
+        self.vehicles_view.show_message("Error", message, is_error=True)
+    
+    @Slot()
+    def _on_lookup_thread_finished(self) -> None:
+        """Release the finished lookup thread and re-enable lookups."""
+        self._lookup_thread = None
+        self._lookup_worker = None
+        self.vehicles_view.set_lookup_busy(False)
+    
+    @Slot(int)
     def handle_vehicle_selected(self, vehicle_id: int) -> None:
         """Handle vehicle selection to show details."""
         if self.user_id is None:
             return
         
-        vehicle = self.vehicle_model.get_vehicle_by_id(self.user_id, vehicle_id)
-        if vehicle:
-            # Get customer and sales history for this vehicle
-            customer = self.vehicle_model.get_customer_for_vehicle(self.user_id, vehicle_id)
-            sales_history = self.vehicle_model.get_sales_history_for_vehicle(self.user_id, vehicle_id)
+        # Vehicle, customer and sales history in one database round trip
+        success, message, vehicle, customer, sales_history = self.vehicle_model.get_vehicle_with_context(
+            self.user_id, vehicle_id
+        )
+        if success:
             self.vehicles_view.show_vehicle_details(vehicle, customer, sales_history)
         else:
-            self.vehicles_view.show_message("Error", "Vehicle not found", is_error=True)
+            self.vehicles_view.show_message("Error", message, is_error=True)
     
+    @Slot(int)
     def handle_vehicle_delete(self, vehicle_id: int) -> None:
         """Handle vehicle delete request."""
         if self.user_id is None:
@@ -194,20 +314,3 @@ class VehiclesController(QObject):
             self.refresh_vehicles()
         else:
             self.vehicles_view.show_message("Error", message, is_error=True)
-    
-    def handle_services(self) -> None:
-        """Handle services navigation."""
-        self.services_requested.emit()
-    
-    def handle_sales(self) -> None:
-        """Handle sales navigation."""
-        self.sales_requested.emit()
-    
-    def handle_configuration(self) -> None:
-        """Handle configuration navigation."""
-        self.configuration_requested.emit()
-    
-    def handle_logout(self) -> None:
-        """Handle logout."""
-        self.logout_requested.emit()
-
@@ -1,133 +1,215 @@
 """Main entry point for the GUI application."""
+import importlib
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Optional
-from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QShortcut, QKeySequence
-from utils.styles import load_theme_stylesheet, apply_theme
+from typing import TYPE_CHECKING, Callable, Optional
+from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox, QWidget
+from PySide6.QtCore import QSize, Qt, QThreadPool, QTimer, Slot
+from PySide6.QtGui import QGuiApplication, QShortcut, QKeySequence
+from utils.styles import apply_application_theme, apply_theme
+from utils.throttle import throttled
 
 from models.user import User
-from models.supplier import Supplier
-from models.customer import Customer
-from models.product import Product
-from models.product_type import ProductType
-from models.invoice import Invoice
-from models.invoice_item import InvoiceItem
-from models.payment import Payment
-from models.payment_allocation import PaymentAllocation
-from models.nominal_account import NominalAccount
-from models.journal_entry import JournalEntry
-from models.api_key import ApiKey
-from models.vehicle import Vehicle
-from models.tyre import Tyre
-from models.service import Service
-from models.sales_invoice import SalesInvoice
-from models.sales_invoice_item import SalesInvoiceItem
-from models.customer_payment import CustomerPayment
-from models.customer_payment_allocation import CustomerPaymentAllocation
 from views.login_view import LoginView
 from views.dashboard_view import DashboardView
-from views.suppliers_view import SuppliersView
-from views.customers_view import CustomersView
-from views.products_view import ProductsView
-from views.inventory_view import InventoryView
-from views.bookkeeper_view import BookkeeperView
-from views.configuration_view import ConfigurationView
-from views.vehicles_view import VehiclesView
-from views.services_view import ServicesView
-from views.sales_view import SalesView
-from views.shortcuts_dialog import ShortcutsDialog
 from controllers.login_controller import LoginController
 from controllers.dashboard_controller import DashboardController
-from controllers.suppliers_controller import SuppliersController
-from controllers.customers_controller import CustomersController
-from controllers.products_controller import ProductsController
-from controllers.inventory_controller import InventoryController
-from controllers.bookkeeper_controller import BookkeeperController
-from controllers.configuration_controller import ConfigurationController
-from controllers.vehicles_controller import VehiclesController
-from controllers.services_controller import ServicesController
-from controllers.sales_controller import SalesController
-from controllers.invoice_controller import InvoiceController
-from controllers.payment_controller import PaymentController
+
+# Everything else is imported where it is first needed (_ensure_models and the
+# _get_*_view getters) so start-up only loads what the login screen uses
+if TYPE_CHECKING:
+    from models.supplier import Supplier
+    from models.customer import Customer
+    from models.product import Product
+    from models.product_type import ProductType
+    from models.invoice import Invoice
+    from models.invoice_item import InvoiceItem
+    from models.payment import Payment
+    from models.payment_allocation import PaymentAllocation
+    from models.nominal_account import NominalAccount
+    from models.journal_entry import JournalEntry
+    from models.api_key import ApiKey
+    from models.vehicle import Vehicle
+    from models.tyre import Tyre
+    from models.service import Service
+    from models.sales_invoice import SalesInvoice
+    from models.sales_invoice_item import SalesInvoiceItem
+    from models.customer_payment import CustomerPayment
+    from models.customer_payment_allocation import CustomerPaymentAllocation
+    from views.suppliers_view import SuppliersView
+    from views.customers_view import CustomersView
+    from views.products_view import ProductsView
+    from views.inventory_view import InventoryView
+    from views.bookkeeper_view import BookkeeperView
+    from views.configuration_view import ConfigurationView
+    from views.vehicles_view import VehiclesView
+    from views.services_view import ServicesView
+    from views.sales_view import SalesView
+
+
+# Section navigation shortcuts: key sequence -> section key for Application._navigate.
+# Sequences are built from key codes so no shortcut strings are parsed at startup.
+_NAVIGATION_SHORTCUTS = (
+    (QKeySequence(Qt.Key.Key_F1), "dashboard"),
+    (QKeySequence(Qt.Key.Key_F2), "suppliers"),
+    (QKeySequence(Qt.Key.Key_F3), "customers"),
+    (QKeySequence(Qt.Key.Key_F4), "products"),
+    (QKeySequence(Qt.Key.Key_F5), "services"),
+    (QKeySequence(Qt.Key.Key_F6), "sales"),
+    (QKeySequence(Qt.Key.Key_F7), "inventory"),
+    (QKeySequence(Qt.Key.Key_F8), "vehicles"),
+    (QKeySequence(Qt.Key.Key_F9), "bookkeeper"),
+    (QKeySequence(Qt.Key.Key_F10), "configuration"),
+)
+
+# The only shortcut that stays enabled while logged out
+_EXIT_SHORTCUT = QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Q)
+
+# Other global keyboard shortcuts: key sequence -> Application handler method
+_SHORTCUTS = (
+    # Add Supplier/Product/Account (context-dependent)
+    (QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_N), "_handle_add_shortcut"),
+    # Transfer Funds (Book Keeper only)
+    (QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_T), "_handle_transfer_shortcut"),
+    # View Tyre Catalogue (Products only)
+    (QKeySequence(Qt.Modifier.CTRL | Qt.Modifier.SHIFT | Qt.Key.Key_C), "_handle_catalogue_shortcut"),
+    # Cash Up (from Dashboard)
+    (QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_U), "_handle_cash_up_shortcut"),
+    # Exit application
+    (_EXIT_SHORTCUT, "_exit_application"),
+)
+
+# Modules of the sections usually opened straight from the dashboard. They are
+# imported on a worker thread after login so the first visit only has to build
+# the widgets, which must stay on the GUI thread.
+_PREWARM_MODULES = (
+    "views.customers_view", "controllers.customers_controller",
+    "views.sales_view", "controllers.sales_controller",
+    "views.products_view", "controllers.products_controller",
+)
+
+
+def _import_modules(names):
+    """Import modules by name (run on a QThreadPool worker)."""
+    for name in names:
+        importlib.import_module(name)
 
 
 class Application(QMainWindow):
     """Main application class to manage views and navigation."""
     
+    # Section key -> (window title, controller attribute, refresh method) used by
+    # _switch_view; the view itself comes from _get_<key>_view
+    _SECTIONS = {
+        "dashboard": ("Dashboard", None, None),
+        "suppliers": ("Suppliers", "suppliers_controller", "refresh_suppliers"),
+        "customers": ("Customers", "customers_controller", "refresh_customers"),
+        "products": ("Products", "products_controller", "refresh_products"),
+        "inventory": ("Inventory", "inventory_controller", "refresh_inventory"),
+        "bookkeeper": ("Book Keeper", "bookkeeper_controller", "refresh_accounts"),
+        "vehicles": ("Vehicles", "vehicles_controller", "refresh_vehicles"),
+        "services": ("Services", "services_controller", "refresh_services"),
+        "sales": ("Sales", "sales_controller", "refresh_documents"),
+        "configuration": ("Configuration", None, None),
+    }
+    
+    # Navigation signal emitted by a section -> Application handler method
+    _NAV_SLOTS = {
+        "dashboard_requested": "on_back_to_dashboard",
+        "suppliers_requested": "on_suppliers",
+        "customers_requested": "on_customers",
+        "products_requested": "on_products",
+        "inventory_requested": "on_inventory",
+        "bookkeeper_requested": "on_bookkeeper",
+        "vehicles_requested": "on_vehicles",
+        "services_requested": "on_services",
+        "sales_requested": "on_sales",
+        "configuration_requested": "on_configuration",
+        "logout_requested": "on_logout",
+    }
+    
+    # Window size (and minimum size) of the login screen
+    _LOGIN_SIZE = QSize(400, 250)
+    # Minimum window size once logged in
+    _POST_LOGIN_MIN_SIZE = QSize(800, 600)
+    
     def __init__(self):
         """Initialize the application."""
         super().__init__()
         
         # Set window properties
         self.setWindowTitle("Login")
-        self.setGeometry(100, 100, 400, 250)
-        self.setMinimumSize(400, 250)
+        self.setGeometry(100, 100, self._LOGIN_SIZE.width(), self._LOGIN_SIZE.height())
+        self.setMinimumSize(self._LOGIN_SIZE)
         
         # Load retro theme
         self._load_theme()
         
-        # Initialize models
+        # Only the user model is needed to log in; the rest (and their database
+        # setup) are created by _ensure_models() once a user has logged in
         self.user_model = User()
-        self.supplier_model = Supplier()
-        self.customer_model = Customer()
-        self.product_model = Product()
-        self.product_type_model = ProductType()
-        self.invoice_model = Invoice()
-        self.invoice_item_model = InvoiceItem()
-        self.payment_model = Payment()
-        self.payment_allocation_model = PaymentAllocation()
-        self.nominal_account_model = NominalAccount()
-        self.journal_entry_model = JournalEntry()
-        self.api_key_model = ApiKey()
-        self.vehicle_model = Vehicle()
-        self.tyre_model = Tyre()
-        self.service_model = Service()
-        self.sales_invoice_model = SalesInvoice()
-        self.sales_invoice_item_model = SalesInvoiceItem()
-        self.customer_payment_model = CustomerPayment()
-        self.customer_payment_allocation_model = CustomerPaymentAllocation()
+        self.supplier_model: Optional["Supplier"] = None
+        self.customer_model: Optional["Customer"] = None
+        self.product_model: Optional["Product"] = None
+        self.product_type_model: Optional["ProductType"] = None
+        self.invoice_model: Optional["Invoice"] = None
+        self.invoice_item_model: Optional["InvoiceItem"] = None
+        self.payment_model: Optional["Payment"] = None
+        self.payment_allocation_model: Optional["PaymentAllocation"] = None
+        self.nominal_account_model: Optional["NominalAccount"] = None
+        self.journal_entry_model: Optional["JournalEntry"] = None
+        self.api_key_model: Optional["ApiKey"] = None
+        self.vehicle_model: Optional["Vehicle"] = None
+        self.tyre_model: Optional["Tyre"] = None
+        self.service_model: Optional["Service"] = None
+        self.sales_invoice_model: Optional["SalesInvoice"] = None
+        self.sales_invoice_item_model: Optional["SalesInvoiceItem"] = None
+        self.customer_payment_model: Optional["CustomerPayment"] = None
+        self.customer_payment_allocation_model: Optional["CustomerPaymentAllocation"] = None
         
         # Current user ID (None until login)
         self.current_user_id: Optional[int] = None
+        # Shortcuts other than exit are only enabled while logged in, so their
+        # handlers never run from the login screen
+        self._logged_in = False
+        self._session_shortcuts: list[QShortcut] = []
+        
+        # Sections whose data may have changed since they were last loaded;
+        # navigating to a clean section skips its database reload
+        self._dirty = {"suppliers": True, "products": True}
+        # Sections built in an earlier session that still show the previous
+        # user's data; they switch user (and reload) when next shown
+        self._user_switch_pending: set[str] = set()
         
         # Create stacked widget for views
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
-        # Initialize views
+        # Only the login screen is built up front; each section's view and
+        # controller are created on first navigation (see the _get_*_view methods)
         self.login_view = LoginView()
-        self.dashboard_view = DashboardView()
-        self.suppliers_view = SuppliersView()
-        self.customers_view = CustomersView()
-        self.products_view = ProductsView()
-        self.inventory_view = InventoryView()
-        self.bookkeeper_view = BookkeeperView()
-        self.vehicles_view = VehiclesView()
-        self.services_view = ServicesView()
-        self.sales_view = SalesView()
-        self.configuration_view = ConfigurationView()
-        
-        # Add views to stacked widget
-        self.login_index = self.stacked_widget.addWidget(self.login_view)
-        self.dashboard_index = self.stacked_widget.addWidget(self.dashboard_view)
-        self.suppliers_index = self.stacked_widget.addWidget(self.suppliers_view)
-        self.customers_index = self.stacked_widget.addWidget(self.customers_view)
-        self.products_index = self.stacked_widget.addWidget(self.products_view)
-        self.inventory_index = self.stacked_widget.addWidget(self.inventory_view)
-        self.bookkeeper_index = self.stacked_widget.addWidget(self.bookkeeper_view)
-        self.vehicles_index = self.stacked_widget.addWidget(self.vehicles_view)
-        self.services_index = self.stacked_widget.addWidget(self.services_view)
-        self.sales_index = self.stacked_widget.addWidget(self.sales_view)
-        self.configuration_index = self.stacked_widget.addWidget(self.configuration_view)
+        self.stacked_widget.addWidget(self.login_view)
+        self.dashboard_view: Optional[DashboardView] = None
+        self.suppliers_view: Optional["SuppliersView"] = None
+        self.customers_view: Optional["CustomersView"] = None
+        self.products_view: Optional["ProductsView"] = None
+        self.inventory_view: Optional["InventoryView"] = None
+        self.bookkeeper_view: Optional["BookkeeperView"] = None
+        self.vehicles_view: Optional["VehiclesView"] = None
+        self.services_view: Optional["ServicesView"] = None
+        self.sales_view: Optional["SalesView"] = None
+        self.configuration_view: Optional["ConfigurationView"] = None
+        
+        # Ctrl+N action of each built view that supports adding records
+        self._add_actions: dict[QWidget, Callable[[], None]] = {}
         
         # Show login view initially
-        self.stacked_widget.setCurrentIndex(self.login_index)
+        self.stacked_widget.setCurrentWidget(self.login_view)
         
         # Initialize controllers
         self.login_controller = LoginController(self.user_model, self.login_view)
-        self.dashboard_controller = DashboardController(self.dashboard_view)
+        self.dashboard_controller = None
         self.suppliers_controller = None
         self.customers_controller = None
         self.products_controller = None
@@ -142,20 +224,18 @@ class Application(QMainWindow):
         
         # Set up navigation callbacks
         self.login_controller.login_success.connect(self.on_login_success)
-        self.dashboard_controller.logout_requested.connect(self.on_logout)
-        self.dashboard_controller.suppliers_requested.connect(self.on_suppliers)
-        self.dashboard_controller.customers_requested.connect(self.on_customers)
-        self.dashboard_controller.products_requested.connect(self.on_products)
-        self.dashboard_controller.inventory_requested.connect(self.on_inventory)
-        self.dashboard_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-        self.dashboard_controller.vehicles_requested.connect(self.on_vehicles)
-        self.dashboard_controller.services_requested.connect(self.on_services)
-        self.dashboard_controller.sales_requested.connect(self.on_sales)
-        self.dashboard_controller.configuration_requested.connect(self.on_configuration)
         
-        # Center the window
+        # Center the window; the screen centre is cached and refreshed on screen changes
+        self._update_screen_center()
+        QApplication.instance().primaryScreenChanged.connect(self._update_screen_center)
         self._center_window()
         
+        # Work the login screen doesn't need runs once the first frame is up
+        QTimer.singleShot(0, self._post_show_init)
+    
+    @Slot()
+    def _post_show_init(self):
+        """Finish start-up after the login window has been shown."""
         # Set up global keyboard shortcuts
         self._setup_shortcuts()
     
@@ -166,411 +246,232 @@ class Application(QMainWindow):
     def _center_window(self):
         """Center the window on the screen."""
         frame_geometry = self.frameGeometry()
-        screen = QApplication.primaryScreen().availableGeometry().center()
-        frame_geometry.moveCenter(screen)
-        self.move(frame_geometry.topLeft())
+        frame_geometry.moveCenter(self._screen_center)
+        top_left = frame_geometry.topLeft()
+        if top_left != self.pos():
+            self.move(top_left)
+    
+    @Slot()
+    def _update_screen_center(self):
+        """Recompute the cached centre of the primary screen's available area."""
+        self._screen_center = QApplication.primaryScreen().availableGeometry().center()
+    
+    def showEvent(self, event):
+        """Track screen changes once the native window exists."""
+        super().showEvent(event)
+        self.windowHandle().screenChanged.connect(
+            self._update_screen_center, Qt.ConnectionType.UniqueConnection
+        )
     
     def _setup_shortcuts(self):
         """Set up global keyboard shortcuts."""
-        # F1: Dashboard
-        self.shortcut_dashboard = QShortcut(QKeySequence("F1"), self)
-        self.shortcut_dashboard.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_dashboard.activated.connect(self._navigate_to_dashboard)
-        
-        # F2: Suppliers
-        self.shortcut_suppliers = QShortcut(QKeySequence("F2"), self)
-        self.shortcut_suppliers.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_suppliers.activated.connect(self._navigate_to_suppliers)
-        
-        # F3: Customers
-        self.shortcut_customers = QShortcut(QKeySequence("F3"), self)
-        self.shortcut_customers.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_customers.activated.connect(self._navigate_to_customers)
-        
-        # F4: Products
-        self.shortcut_products = QShortcut(QKeySequence("F4"), self)
-        self.shortcut_products.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_products.activated.connect(self._navigate_to_products)
-        
-        # F5: Services
-        self.shortcut_services = QShortcut(QKeySequence("F5"), self)
-        self.shortcut_services.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_services.activated.connect(self._navigate_to_services)
-        
-        # F6: Sales
-        self.shortcut_sales = QShortcut(QKeySequence("F6"), self)
-        self.shortcut_sales.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_sales.activated.connect(self._navigate_to_sales)
-        
-        # F7: Inventory
-        self.shortcut_inventory = QShortcut(QKeySequence("F7"), self)
-        self.shortcut_inventory.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_inventory.activated.connect(self._navigate_to_inventory)
-        
-        # F8: Vehicles
-        self.shortcut_vehicles = QShortcut(QKeySequence("F8"), self)
-        self.shortcut_vehicles.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_vehicles.activated.connect(self._navigate_to_vehicles)
-        
-        # F9: Book Keeper
-        self.shortcut_bookkeeper = QShortcut(QKeySequence("F9"), self)
-        self.shortcut_bookkeeper.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_bookkeeper.activated.connect(self._navigate_to_bookkeeper)
-        
-        # F10: Configuration
-        self.shortcut_configuration = QShortcut(QKeySequence("F10"), self)
-        self.shortcut_configuration.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_configuration.activated.connect(self._navigate_to_configuration)
-        
-        # Ctrl+N: Add Supplier/Product/Account (context-dependent)
-        self.shortcut_add = QShortcut(QKeySequence("Ctrl+N"), self)
-        self.shortcut_add.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_add.activated.connect(self._handle_add_shortcut)
-        
-        # Ctrl+T: Transfer Funds (Book Keeper only)
-        self.shortcut_transfer = QShortcut(QKeySequence("Ctrl+T"), self)
-        self.shortcut_transfer.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_transfer.activated.connect(self._handle_transfer_shortcut)
-        
-        # Ctrl+Shift+C: View Tyre Catalogue (Products only)
-        self.shortcut_catalogue = QShortcut(QKeySequence("Ctrl+Shift+C"), self)
-        self.shortcut_catalogue.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_catalogue.activated.connect(self._handle_catalogue_shortcut)
-        
-        # Ctrl+U: Cash Up (from Dashboard)
-        self.shortcut_cash_up = QShortcut(QKeySequence("Ctrl+U"), self)
-        self.shortcut_cash_up.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_cash_up.activated.connect(self._handle_cash_up_shortcut)
-        
-        # Ctrl+Q: Exit application
-        self.shortcut_quit = QShortcut(QKeySequence("Ctrl+Q"), self)
-        self.shortcut_quit.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.shortcut_quit.activated.connect(self._exit_application)
-    
-    def _navigate_to_dashboard(self):
-        """Navigate to dashboard if logged in."""
-        if self.current_user_id is not None:
-            self.dashboard_view.nav_panel.set_current_view("dashboard")
-            self.stacked_widget.setCurrentIndex(self.dashboard_index)
-            self.setWindowTitle("Dashboard")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_suppliers(self):
-        """Navigate to suppliers if logged in."""
-        if self.current_user_id is not None:
-            if self.suppliers_controller:
-                self.suppliers_controller.refresh_suppliers()
-            self.suppliers_view.nav_panel.set_current_view("suppliers")
-            self.stacked_widget.setCurrentIndex(self.suppliers_index)
-            self.setWindowTitle("Suppliers")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_customers(self):
-        """Navigate to customers if logged in."""
-        if self.current_user_id is not None:
-            if self.customers_controller:
-                self.customers_controller.refresh_customers()
-            self.customers_view.nav_panel.set_current_view("customers")
-            self.stacked_widget.setCurrentIndex(self.customers_index)
-            self.setWindowTitle("Customers")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_products(self):
-        """Navigate to products if logged in."""
-        if self.current_user_id is not None:
-            if self.products_controller:
-                self.products_controller.refresh_products()
-            self.products_view.nav_panel.set_current_view("products")
-            self.stacked_widget.setCurrentIndex(self.products_index)
-            self.setWindowTitle("Products")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_inventory(self):
-        """Navigate to inventory if logged in."""
-        if self.current_user_id is not None:
-            if self.inventory_controller:
-                self.inventory_controller.refresh_inventory()
-            self.inventory_view.nav_panel.set_current_view("inventory")
-            self.stacked_widget.setCurrentIndex(self.inventory_index)
-            self.setWindowTitle("Inventory")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_bookkeeper(self):
-        """Navigate to bookkeeper if logged in."""
-        if self.current_user_id is not None:
-            if self.bookkeeper_controller:
-                self.bookkeeper_controller.refresh_accounts()
-            self.bookkeeper_view.nav_panel.set_current_view("bookkeeper")
-            self.stacked_widget.setCurrentIndex(self.bookkeeper_index)
-            self.setWindowTitle("Book Keeper")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_vehicles(self):
-        """Navigate to vehicles if logged in."""
-        if self.current_user_id is not None:
-            if self.vehicles_controller:
-                self.vehicles_controller.refresh_vehicles()
-            self.vehicles_view.nav_panel.set_current_view("vehicles")
-            self.stacked_widget.setCurrentIndex(self.vehicles_index)
-            self.setWindowTitle("Vehicles")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_services(self):
-        """Navigate to services if logged in."""
-        if self.current_user_id is not None:
-            if self.services_controller:
-                self.services_controller.refresh_services()
-            self.services_view.nav_panel.set_current_view("services")
-            self.stacked_widget.setCurrentIndex(self.services_index)
-            self.setWindowTitle("Services")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_sales(self):
-        """Navigate to sales if logged in."""
-        if self.current_user_id is not None:
-            if self.sales_controller:
-                self.sales_controller.refresh_documents()
-            self.sales_view.nav_panel.set_current_view("sales")
-            self.stacked_widget.setCurrentIndex(self.sales_index)
-            self.setWindowTitle("Sales")
-            self.setMinimumSize(800, 600)
-    
-    def _navigate_to_configuration(self):
-        """Navigate to configuration if logged in."""
-        if self.current_user_id is not None:
-            self.configuration_view.nav_panel.set_current_view("configuration")
-            self.stacked_widget.setCurrentIndex(self.configuration_index)
-            self.setWindowTitle("Configuration")
-            self.setMinimumSize(800, 600)
-    
-    def _handle_add_shortcut(self):
-        """Handle add item keyboard shortcut (supplier, customer, product, service, or account)."""
-        if self.current_user_id is not None:
-            current_index = self.stacked_widget.currentIndex()
-            if current_index == self.suppliers_index:
-                self.suppliers_view.add_supplier()
-            elif current_index == self.customers_index:
-                self.customers_view.add_customer()
-            elif current_index == self.products_index:
-                self.products_view.add_product()
-            elif current_index == self.services_index:
-                self.services_view.add_service()
-            elif current_index == self.sales_index:
-                self.sales_view.add_document()
-            elif current_index == self.bookkeeper_index:
-                self.bookkeeper_view.add_account()
-    
-    def _handle_transfer_shortcut(self):
-        """Handle transfer funds keyboard shortcut (Book Keeper only)."""
-        if self.current_user_id is not None:
-            current_index = self.stacked_widget.currentIndex()
-            if current_index == self.bookkeeper_index:
-                self.bookkeeper_view.transfer_funds()
-    
-    def _handle_catalogue_shortcut(self):
-        """Handle view catalogue keyboard shortcut (Products only)."""
-        if self.current_user_id is not None:
-            current_index = self.stacked_widget.currentIndex()
-            if current_index == self.products_index:
-                self.products_view._handle_view_catalogue()
-    
-    def _handle_cash_up_shortcut(self):
-        """Handle cash up keyboard shortcut (from Dashboard)."""
-        if self.current_user_id is not None:
-            current_index = self.stacked_widget.currentIndex()
-            if current_index == self.dashboard_index:
-                # Call the controller's handler directly
-                self.dashboard_controller.handle_cash_up_navigation()
-    
-    def _exit_application(self):
-        """Exit the application with confirmation."""
-        reply = QMessageBox.question(
-            self,
-            "Exit Application",
-            "Are you sure you want to exit the application?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+        context = Qt.ShortcutContext.ApplicationShortcut
+        self._shortcuts = [
+            QShortcut(sequence, self, activated=partial(self._navigate, key), context=context)
+            for sequence, key in _NAVIGATION_SHORTCUTS
+        ]
+        self._shortcuts.extend(
+            QShortcut(sequence, self, activated=getattr(self, handler), context=context)
+            for sequence, handler in _SHORTCUTS
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            QApplication.instance().quit()
-    
-    def on_login_success(self, username: str, user_id: int):
-        """Handle successful login."""
-        # Store current user ID
-        self.current_user_id = user_id
-        
-        # Initialize invoice and payment controllers
-        if self.invoice_controller is None:
-            self.invoice_controller = InvoiceController(
-                self.invoice_model,
-                self.invoice_item_model,
-                user_id
-            )
-        else:
-            self.invoice_controller.set_user_id(user_id)
-        
-        if self.payment_controller is None:
-            self.payment_controller = PaymentController(
-                self.payment_model,
-                self.payment_allocation_model,
-                self.invoice_model,
-                user_id
-            )
-        else:
-            self.payment_controller.set_user_id(user_id)
-        
-        # Initialize or update suppliers controller with user_id
-        if self.suppliers_controller is None:
+        self._session_shortcuts = [
+            shortcut for shortcut in self._shortcuts
+            if shortcut.key() != _EXIT_SHORTCUT
+        ]
+        self._set_session_shortcuts_enabled(self._logged_in)
+    
+    def _set_session_shortcuts_enabled(self, enabled: bool):
+        """Enable or disable every shortcut except exit."""
+        for shortcut in self._session_shortcuts:
+            shortcut.setEnabled(enabled)
+    
+    def _ensure_models(self):
+        """Create the data models on first login."""
+        if self.supplier_model is None:
+            from models.supplier import Supplier
+            from models.customer import Customer
+            from models.product import Product
+            from models.product_type import ProductType
+            from models.invoice import Invoice
+            from models.invoice_item import InvoiceItem
+            from models.payment import Payment
+            from models.payment_allocation import PaymentAllocation
+            from models.nominal_account import NominalAccount
+            from models.journal_entry import JournalEntry
+            from models.api_key import ApiKey
+            from models.vehicle import Vehicle
+            from models.tyre import Tyre
+            from models.service import Service
+            from models.sales_invoice import SalesInvoice
+            from models.sales_invoice_item import SalesInvoiceItem
+            from models.customer_payment import CustomerPayment
+            from models.customer_payment_allocation import CustomerPaymentAllocation
+            
+            self.supplier_model = Supplier()
+            self.customer_model = Customer()
+            self.product_model = Product()
+            self.product_type_model = ProductType()
+            self.invoice_model = Invoice()
+            self.invoice_item_model = InvoiceItem()
+            self.payment_model = Payment()
+            self.payment_allocation_model = PaymentAllocation()
+            self.nominal_account_model = NominalAccount()
+            self.journal_entry_model = JournalEntry()
+            self.api_key_model = ApiKey()
+            self.vehicle_model = Vehicle()
+            self.tyre_model = Tyre()
+            self.service_model = Service()
+            self.sales_invoice_model = SalesInvoice()
+            self.sales_invoice_item_model = SalesInvoiceItem()
+            self.customer_payment_model = CustomerPayment()
+            self.customer_payment_allocation_model = CustomerPaymentAllocation()
+    
+    def _get_dashboard_view(self) -> DashboardView:
+        """Get the dashboard view, creating it and its controller on first use."""
+        if self.dashboard_view is None:
+            self.dashboard_view = DashboardView()
+            self.stacked_widget.addWidget(self.dashboard_view)
+            self.dashboard_controller = DashboardController(self.dashboard_view)
+            self._wire_nav(self.dashboard_controller, skip="dashboard_requested")
+        return self.dashboard_view
+    
+    def _get_suppliers_view(self) -> "SuppliersView":
+        """Get the suppliers view, creating it and its controller on first use."""
+        if self.suppliers_view is None:
+            from views.suppliers_view import SuppliersView
+            from controllers.suppliers_controller import SuppliersController
+            
+            self.suppliers_view = SuppliersView()
+            self.stacked_widget.addWidget(self.suppliers_view)
+            self._add_actions[self.suppliers_view] = self.suppliers_view.add_supplier
             self.suppliers_controller = SuppliersController(
                 self.suppliers_view, 
                 self.supplier_model, 
-                user_id,
+                self.current_user_id,
                 self.invoice_controller,
                 self.payment_controller,
                 self.product_model,
                 self.tyre_model
             )
-            self.suppliers_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.suppliers_controller.customers_requested.connect(self.on_customers)
-            self.suppliers_controller.products_requested.connect(self.on_products)
-            self.suppliers_controller.inventory_requested.connect(self.on_inventory)
-            self.suppliers_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.suppliers_controller.vehicles_requested.connect(self.on_vehicles)
-            self.suppliers_controller.services_requested.connect(self.on_services)
-            self.suppliers_controller.sales_requested.connect(self.on_sales)
-            self.suppliers_controller.configuration_requested.connect(self.on_configuration)
-            self.suppliers_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.suppliers_controller.set_user_id(user_id)
-        
-        # Initialize or update customers controller with user_id
-        if self.customers_controller is None:
+            # Navigation signals come straight from the view (no controller relay)
+            self._wire_nav(self.suppliers_view, skip="suppliers_requested")
+        return self.suppliers_view
+    
+    def _get_customers_view(self) -> "CustomersView":
+        """Get the customers view, creating it and its controller on first use."""
+        if self.customers_view is None:
+            from views.customers_view import CustomersView
+            from controllers.customers_controller import CustomersController
+            
+            self.customers_view = CustomersView()
+            self.stacked_widget.addWidget(self.customers_view)
+            self._add_actions[self.customers_view] = self.customers_view.add_customer
             self.customers_controller = CustomersController(
                 self.customers_view,
                 self.customer_model,
-                user_id
+                self.current_user_id
             )
-            self.customers_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.customers_controller.suppliers_requested.connect(self.on_suppliers)
-            self.customers_controller.products_requested.connect(self.on_products)
-            self.customers_controller.inventory_requested.connect(self.on_inventory)
-            self.customers_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.customers_controller.vehicles_requested.connect(self.on_vehicles)
-            self.customers_controller.services_requested.connect(self.on_services)
-            self.customers_controller.sales_requested.connect(self.on_sales)
-            self.customers_controller.configuration_requested.connect(self.on_configuration)
-            self.customers_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.customers_controller.set_user_id(user_id)
-        
-        # Initialize or update products controller with user_id
-        if self.products_controller is None:
+            self._wire_nav(self.customers_controller, skip="customers_requested")
+        return self.customers_view
+    
+    def _get_products_view(self) -> "ProductsView":
+        """Get the products view, creating it and its controller on first use."""
+        if self.products_view is None:
+            from views.products_view import ProductsView
+            from controllers.products_controller import ProductsController
+            
+            self.products_view = ProductsView()
+            self.stacked_widget.addWidget(self.products_view)
+            self._add_actions[self.products_view] = self.products_view.add_product
             self.products_controller = ProductsController(
                 self.products_view,
                 self.product_model,
                 self.product_type_model,
                 self.tyre_model,
-                user_id
+                self.current_user_id
             )
-            self.products_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.products_controller.suppliers_requested.connect(self.on_suppliers)
-            self.products_controller.customers_requested.connect(self.on_customers)
-            self.products_controller.inventory_requested.connect(self.on_inventory)
-            self.products_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.products_controller.vehicles_requested.connect(self.on_vehicles)
-            self.products_controller.services_requested.connect(self.on_services)
-            self.products_controller.sales_requested.connect(self.on_sales)
-            self.products_controller.configuration_requested.connect(self.on_configuration)
-            self.products_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.products_controller.set_user_id(user_id)
-        
-        # Initialize or update inventory controller with user_id
-        if self.inventory_controller is None:
+            self._wire_nav(self.products_controller, skip="products_requested")
+        return self.products_view
+    
+    def _get_inventory_view(self) -> "InventoryView":
+        """Get the inventory view, creating it and its controller on first use."""
+        if self.inventory_view is None:
+            from views.inventory_view import InventoryView
+            from controllers.inventory_controller import InventoryController
+            
+            self.inventory_view = InventoryView()
+            self.stacked_widget.addWidget(self.inventory_view)
             self.inventory_controller = InventoryController(
                 self.inventory_view,
                 self.product_model,
-                user_id
+                self.current_user_id
             )
-            self.inventory_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.inventory_controller.suppliers_requested.connect(self.on_suppliers)
-            self.inventory_controller.customers_requested.connect(self.on_customers)
-            self.inventory_controller.products_requested.connect(self.on_products)
-            self.inventory_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.inventory_controller.vehicles_requested.connect(self.on_vehicles)
-            self.inventory_controller.services_requested.connect(self.on_services)
-            self.inventory_controller.sales_requested.connect(self.on_sales)
-            self.inventory_controller.configuration_requested.connect(self.on_configuration)
-            self.inventory_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.inventory_controller.set_user_id(user_id)
-        
-        # Initialize or update bookkeeper controller with user_id
-        if self.bookkeeper_controller is None:
+            self._wire_nav(self.inventory_controller, skip="inventory_requested")
+        return self.inventory_view
+    
+    def _get_bookkeeper_view(self) -> "BookkeeperView":
+        """Get the bookkeeper view, creating it and its controller on first use."""
+        if self.bookkeeper_view is None:
+            from views.bookkeeper_view import BookkeeperView
+            from controllers.bookkeeper_controller import BookkeeperController
+            
+            self.bookkeeper_view = BookkeeperView()
+            self.stacked_widget.addWidget(self.bookkeeper_view)
+            self._add_actions[self.bookkeeper_view] = self.bookkeeper_view.add_account
             self.bookkeeper_controller = BookkeeperController(
                 self.bookkeeper_view,
                 self.nominal_account_model,
                 self.journal_entry_model,
-                user_id
+                self.current_user_id
             )
-            self.bookkeeper_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.bookkeeper_controller.suppliers_requested.connect(self.on_suppliers)
-            self.bookkeeper_controller.customers_requested.connect(self.on_customers)
-            self.bookkeeper_controller.products_requested.connect(self.on_products)
-            self.bookkeeper_controller.inventory_requested.connect(self.on_inventory)
-            self.bookkeeper_controller.vehicles_requested.connect(self.on_vehicles)
-            self.bookkeeper_controller.services_requested.connect(self.on_services)
-            self.bookkeeper_controller.sales_requested.connect(self.on_sales)
-            self.bookkeeper_controller.configuration_requested.connect(self.on_configuration)
-            self.bookkeeper_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.bookkeeper_controller.set_user_id(user_id)
-        
-        # Initialize or update vehicles controller
-        if self.vehicles_controller is None:
+            self._wire_nav(self.bookkeeper_controller, skip="bookkeeper_requested")
+        return self.bookkeeper_view
+    
+    def _get_vehicles_view(self) -> "VehiclesView":
+        """Get the vehicles view, creating it and its controller on first use."""
+        if self.vehicles_view is None:
+            from views.vehicles_view import VehiclesView
+            from controllers.vehicles_controller import VehiclesController
+            
+            self.vehicles_view = VehiclesView()
+            self.stacked_widget.addWidget(self.vehicles_view)
             self.vehicles_controller = VehiclesController(
                 self.vehicles_view,
                 self.vehicle_model,
                 self.api_key_model,
-                user_id
+                self.current_user_id
             )
-            self.vehicles_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.vehicles_controller.suppliers_requested.connect(self.on_suppliers)
-            self.vehicles_controller.customers_requested.connect(self.on_customers)
-            self.vehicles_controller.products_requested.connect(self.on_products)
-            self.vehicles_controller.inventory_requested.connect(self.on_inventory)
-            self.vehicles_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.vehicles_controller.services_requested.connect(self.on_services)
-            self.vehicles_controller.sales_requested.connect(self.on_sales)
-            self.vehicles_controller.configuration_requested.connect(self.on_configuration)
-            self.vehicles_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.vehicles_controller.set_user_id(user_id)
-        
-        # Initialize or update services controller
-        if self.services_controller is None:
+            # Navigation signals come straight from the view (no controller relay)
+            self._wire_nav(self.vehicles_view, skip="vehicles_requested")
+        return self.vehicles_view
+    
+    def _get_services_view(self) -> "ServicesView":
+        """Get the services view, creating it and its controller on first use."""
+        if self.services_view is None:
+            from views.services_view import ServicesView
+            from controllers.services_controller import ServicesController
+            
+            self.services_view = ServicesView()
+            self.stacked_widget.addWidget(self.services_view)
+            self._add_actions[self.services_view] = self.services_view.add_service
             self.services_controller = ServicesController(
                 self.services_view,
                 self.service_model,
                 self.nominal_account_model,
-                user_id
+                self.current_user_id
             )
-            self.services_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.services_controller.suppliers_requested.connect(self.on_suppliers)
-            self.services_controller.customers_requested.connect(self.on_customers)
-            self.services_controller.products_requested.connect(self.on_products)
-            self.services_controller.inventory_requested.connect(self.on_inventory)
-            self.services_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.services_controller.vehicles_requested.connect(self.on_vehicles)
-            self.services_controller.sales_requested.connect(self.on_sales)
-            self.services_controller.configuration_requested.connect(self.on_configuration)
-            self.services_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.services_controller.set_user_id(user_id)
-        
-        # Initialize or update sales controller
-        if self.sales_controller is None:
+            self._wire_nav(self.services_controller, skip="services_requested")
+        return self.services_view
+    
+    def _get_sales_view(self) -> "SalesView":
+        """Get the sales view, creating it and its controller on first use."""
+        if self.sales_view is None:
+            from views.sales_view import SalesView
+            from controllers.sales_controller import SalesController
+            
+            self.sales_view = SalesView()
+            self.stacked_widget.addWidget(self.sales_view)
+            self._add_actions[self.sales_view] = self.sales_view.add_document
             self.sales_controller = SalesController(
                 self.sales_view,
                 self.sales_invoice_model,
@@ -581,186 +482,282 @@ class Application(QMainWindow):
                 self.product_model,
                 self.service_model,
                 self.vehicle_model,
-                user_id
+                self.current_user_id
             )
-            self.sales_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.sales_controller.suppliers_requested.connect(self.on_suppliers)
-            self.sales_controller.customers_requested.connect(self.on_customers)
-            self.sales_controller.products_requested.connect(self.on_products)
-            self.sales_controller.inventory_requested.connect(self.on_inventory)
-            self.sales_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.sales_controller.vehicles_requested.connect(self.on_vehicles)
-            self.sales_controller.services_requested.connect(self.on_services)
-            self.sales_controller.configuration_requested.connect(self.on_configuration)
-            self.sales_controller.logout_requested.connect(self.on_logout)
-        else:
-            self.sales_controller.set_user_id(user_id)
-        
-        # Initialize or update configuration controller
-        if self.configuration_controller is None:
+            self._wire_nav(self.sales_controller, skip="sales_requested")
+        return self.sales_view
+    
+    def _get_configuration_view(self) -> "ConfigurationView":
+        """Get the configuration view, creating it and its controller on first use."""
+        if self.configuration_view is None:
+            from views.configuration_view import ConfigurationView
+            from controllers.configuration_controller import ConfigurationController
+            
+            self.configuration_view = ConfigurationView()
+            self.stacked_widget.addWidget(self.configuration_view)
             self.configuration_controller = ConfigurationController(
                 self.configuration_view,
                 self.api_key_model,
+                self.current_user_id
+            )
+            self._wire_nav(self.configuration_controller, skip="configuration_requested")
+            # Saved/cleared API keys must not be served from the vehicles lookup cache
+            self.configuration_controller.api_key_changed.connect(self._on_api_key_changed)
+        return self.configuration_view
+    
+    def _wire_nav(self, source, skip: str):
+        """Connect a section's navigation signals (all but its own, ``skip``) to the handlers."""
+        # UniqueConnection makes wiring the same source twice a no-op instead of
+        # running every navigation twice
+        for signal_name, handler_name in self._NAV_SLOTS.items():
+            if signal_name != skip:
+                getattr(source, signal_name).connect(
+                    getattr(self, handler_name), Qt.ConnectionType.UniqueConnection
+                )
+    
+    @Slot(str)
+    def _on_api_key_changed(self, service_name: str):
+        """Drop the vehicles controller's cached API key after Configuration changes it."""
+        if self.vehicles_controller:
+            self.vehicles_controller.invalidate_api_key_cache(service_name)
+    
+    def _switch_view(self, key: str):
+        """Refresh a section and show it, skipping window updates that would be no-ops."""
+        title = self._SECTIONS[key][0]
+        if key in self._user_switch_pending:
+            # set_user_id reloads the section for the new user
+            self._user_switch_pending.discard(key)
+            getattr(self, f"{key}_controller").set_user_id(self.current_user_id)
+        else:
+            self._refresh_section(key)
+        view = getattr(self, f"_get_{key}_view")()
+        if self.stacked_widget.currentWidget() is view:
+            return
+        # Update navigation highlighting and switch views
+        view.nav_panel.set_current_view(key)
+        self.stacked_widget.setCurrentWidget(view)
+        # The post-login minimum size is set once in on_login_success
+        if self.windowTitle() != title:
+            self.setWindowTitle(title)
+    
+    @throttled(0.25)
+    def _refresh_section(self, key: str):
+        """Reload a section's data, at most once per 250 ms so held navigation keys can't hammer the database."""
+        if not self._dirty.get(key, True):
+            return
+        _title, controller_attr, refresh_method = self._SECTIONS[key]
+        # A section without a controller yet loads fresh data when it is built
+        if controller_attr and (controller := getattr(self, controller_attr)):
+            getattr(controller, refresh_method)()
+        if key in self._dirty:
+            self._dirty[key] = False
+    
+    def mark_dirty(self, key: str):
+        """Flag a section's data as changed so the next navigation to it reloads."""
+        if key in self._dirty:
+            self._dirty[key] = True
+    
+    @Slot()
+    def _on_invoice_items_changed(self):
+        """Mark products dirty after invoice item changes (items can create catalogue products)."""
+        self.mark_dirty("products")
+    
+    def _apply_window_state(self, title: str, min_size: QSize, resize_to: Optional[QSize] = None):
+        """Apply title and size changes in one pass, skipping the ones already in effect.
+        
+        Updates are suspended so Qt lays out and repaints once. The window is
+        re-centred only when it is resized.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            if self.windowTitle() != title:
+                self.setWindowTitle(title)
+            if self.minimumSize() != min_size:
+                self.setMinimumSize(min_size)
+            if resize_to is not None:
+                if self.size() != resize_to:
+                    self.resize(resize_to)
+                self._center_window()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _navigate(self, key: str):
+        """Navigate to a section (keyboard shortcuts)."""
+        self._switch_view(key)
+    
+    @Slot()
+    @throttled(0.25)
+    def _handle_add_shortcut(self):
+        """Handle add item keyboard shortcut (supplier, customer, product, service, or account)."""
+        add_action = self._add_actions.get(self.stacked_widget.currentWidget())
+        if add_action:
+            add_action()
+    
+    @Slot()
+    def _handle_transfer_shortcut(self):
+        """Handle transfer funds keyboard shortcut (Book Keeper only)."""
+        if self.stacked_widget.currentWidget() is self.bookkeeper_view:
+            self.bookkeeper_view.transfer_funds()
+    
+    @Slot()
+    def _handle_catalogue_shortcut(self):
+        """Handle view catalogue keyboard shortcut (Products only)."""
+        if self.stacked_widget.currentWidget() is self.products_view:
+            self.products_view._handle_view_catalogue()
+    
+    @Slot()
+    def _handle_cash_up_shortcut(self):
+        """Handle cash up keyboard shortcut (from Dashboard)."""
+        if self.stacked_widget.currentWidget() is self.dashboard_view:
+            # Call the controller's handler directly
+            self.dashboard_controller.handle_cash_up_navigation()
+    
+    @Slot()
+    def _exit_application(self):
+        """Exit the application with confirmation."""
+        reply = QMessageBox.question(
+            self,
+            "Exit Application",
+            "Are you sure you want to exit the application?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            QApplication.instance().quit()
+    
+    @Slot(str, int)
+    def on_login_success(self, username: str, user_id: int):
+        """Handle successful login."""
+        # Store current user ID
+        self.current_user_id = user_id
+        self._logged_in = True
+        self._set_session_shortcuts_enabled(True)
+        self._ensure_models()
+        
+        # Initialize invoice and payment controllers
+        from controllers.invoice_controller import InvoiceController
+        from controllers.payment_controller import PaymentController
+        
+        if self.invoice_controller is None:
+            self.invoice_controller = InvoiceController(
+                self.invoice_model,
+                self.invoice_item_model,
                 user_id
             )
-            self.configuration_controller.dashboard_requested.connect(self.on_back_to_dashboard)
-            self.configuration_controller.suppliers_requested.connect(self.on_suppliers)
-            self.configuration_controller.customers_requested.connect(self.on_customers)
-            self.configuration_controller.products_requested.connect(self.on_products)
-            self.configuration_controller.inventory_requested.connect(self.on_inventory)
-            self.configuration_controller.bookkeeper_requested.connect(self.on_bookkeeper)
-            self.configuration_controller.vehicles_requested.connect(self.on_vehicles)
-            self.configuration_controller.services_requested.connect(self.on_services)
-            self.configuration_controller.sales_requested.connect(self.on_sales)
-            self.configuration_controller.logout_requested.connect(self.on_logout)
+            for name in ("item_added", "item_updated", "item_deleted"):
+                getattr(self.invoice_controller, name).connect(self._on_invoice_items_changed)
         else:
-            self.configuration_controller.set_user_id(user_id)
+            self.invoice_controller.set_user_id(user_id)
+        
+        if self.payment_controller is None:
+            self.payment_controller = PaymentController(
+                self.payment_model,
+                self.payment_allocation_model,
+                self.invoice_model,
+                user_id
+            )
+        else:
+            self.payment_controller.set_user_id(user_id)
+        
+        # Sections visited in an earlier session switch to the new user when
+        # they are next shown, so login doesn't reload every one of them;
+        # the rest are built with this user on first navigation
+        self._user_switch_pending = {
+            key for key in self._SECTIONS
+            if key != "dashboard" and getattr(self, f"{key}_controller") is not None
+        }
         
         # Update dashboard controller with user_id
+        dashboard_view = self._get_dashboard_view()
         self.dashboard_controller.set_user_id(user_id)
         
         # Update window for dashboard - maximize to full screen
-        self.setWindowTitle("Dashboard")
-        self.setMinimumSize(800, 600)
+        self._apply_window_state("Dashboard", self._POST_LOGIN_MIN_SIZE)
         self.showMaximized()
         
         # Update navigation highlighting
-        self.dashboard_view.nav_panel.set_current_view("dashboard")
+        dashboard_view.nav_panel.set_current_view("dashboard")
         # Switch views
-        self.stacked_widget.setCurrentIndex(self.dashboard_index)
-        self.dashboard_view.set_username(username)
+        self.stacked_widget.setCurrentWidget(dashboard_view)
+        dashboard_view.set_username(username)
+        
+        # Load the likely next sections' code while the user reads the dashboard
+        pending = [name for name in _PREWARM_MODULES if name not in sys.modules]
+        if pending:
+            QThreadPool.globalInstance().start(partial(_import_modules, pending))
     
+    @Slot()
     def on_suppliers(self):
         """Handle navigation to suppliers."""
-        # Refresh suppliers for current user
-        if self.suppliers_controller:
-            self.suppliers_controller.refresh_suppliers()
-        # Update navigation highlighting
-        self.suppliers_view.nav_panel.set_current_view("suppliers")
-        # Switch to suppliers view
-        self.stacked_widget.setCurrentIndex(self.suppliers_index)
-        self.setWindowTitle("Suppliers")
-        self.setMinimumSize(800, 600)
+        self._switch_view("suppliers")
     
+    @Slot()
     def on_customers(self):
         """Handle navigation to customers."""
-        # Refresh customers for current user
-        if self.customers_controller:
-            self.customers_controller.refresh_customers()
-        # Update navigation highlighting
-        self.customers_view.nav_panel.set_current_view("customers")
-        # Switch to customers view
-        self.stacked_widget.setCurrentIndex(self.customers_index)
-        self.setWindowTitle("Customers")
-        self.setMinimumSize(800, 600)
+        self._switch_view("customers")
     
+    @Slot()
     def on_products(self):
         """Handle navigation to products."""
-        # Refresh products for current user
-        if self.products_controller:
-            self.products_controller.refresh_products()
-        # Update navigation highlighting
-        self.products_view.nav_panel.set_current_view("products")
-        # Switch to products view
-        self.stacked_widget.setCurrentIndex(self.products_index)
-        self.setWindowTitle("Products")
-        self.setMinimumSize(800, 600)
+        self._switch_view("products")
     
+    @Slot()
     def on_inventory(self):
         """Handle navigation to inventory."""
-        # Refresh inventory for current user
-        if self.inventory_controller:
-            self.inventory_controller.refresh_inventory()
-        # Update navigation highlighting
-        self.inventory_view.nav_panel.set_current_view("inventory")
-        # Switch to inventory view
-        self.stacked_widget.setCurrentIndex(self.inventory_index)
-        self.setWindowTitle("Inventory")
-        self.setMinimumSize(800, 600)
+        self._switch_view("inventory")
     
+    @Slot()
     def on_bookkeeper(self):
         """Handle navigation to bookkeeper."""
-        # Refresh accounts for current user
-        if self.bookkeeper_controller:
-            self.bookkeeper_controller.refresh_accounts()
-        # Update navigation highlighting
-        self.bookkeeper_view.nav_panel.set_current_view("bookkeeper")
-        # Switch to bookkeeper view
-        self.stacked_widget.setCurrentIndex(self.bookkeeper_index)
-        self.setWindowTitle("Book Keeper")
-        self.setMinimumSize(800, 600)
+        self._switch_view("bookkeeper")
     
+    @Slot()
     def on_vehicles(self):
         """Handle navigation to vehicles."""
-        # Refresh vehicles for current user
-        if self.vehicles_controller:
-            self.vehicles_controller.refresh_vehicles()
-        # Update navigation highlighting
-        self.vehicles_view.nav_panel.set_current_view("vehicles")
-        # Switch to vehicles view
-        self.stacked_widget.setCurrentIndex(self.vehicles_index)
-        self.setWindowTitle("Vehicles")
-        self.setMinimumSize(800, 600)
+        self._switch_view("vehicles")
     
+    @Slot()
     def on_services(self):
         """Handle navigation to services."""
-        # Refresh services for current user
-        if self.services_controller:
-            self.services_controller.refresh_services()
-        # Update navigation highlighting
-        self.services_view.nav_panel.set_current_view("services")
-        # Switch to services view
-        self.stacked_widget.setCurrentIndex(self.services_index)
-        self.setWindowTitle("Services")
-        self.setMinimumSize(800, 600)
+        self._switch_view("services")
     
+    @Slot()
     def on_sales(self):
         """Handle navigation to sales."""
-        # Refresh sales documents for current user
-        if self.sales_controller:
-            self.sales_controller.refresh_documents()
-        # Update navigation highlighting
-        self.sales_view.nav_panel.set_current_view("sales")
-        # Switch to sales view
-        self.stacked_widget.setCurrentIndex(self.sales_index)
-        self.setWindowTitle("Sales")
-        self.setMinimumSize(800, 600)
+        self._switch_view("sales")
     
+    @Slot()
     def on_configuration(self):
         """Handle navigation to configuration."""
-        # Update navigation highlighting
-        self.configuration_view.nav_panel.set_current_view("configuration")
-        # Switch to configuration view
-        self.stacked_widget.setCurrentIndex(self.configuration_index)
-        self.setWindowTitle("Configuration")
-        self.setMinimumSize(800, 600)
+        self._switch_view("configuration")
     
+    @Slot()
     def _refresh_product_types_after_change(self):
         """Refresh product types in products view after configuration changes."""
         # This will be called after type creation/deletion completes
+        self.mark_dirty("products")
         if self.products_controller:
             self.products_controller.refresh_types()
     
+    @Slot()
     def on_back_to_dashboard(self):
         """Handle navigation back to dashboard."""
-        # Update navigation highlighting
-        self.dashboard_view.nav_panel.set_current_view("dashboard")
-        # Switch to dashboard view
-        self.stacked_widget.setCurrentIndex(self.dashboard_index)
-        self.setWindowTitle("Dashboard")
-        self.setMinimumSize(800, 600)
+        self._switch_view("dashboard")
     
+    @Slot()
     def on_logout(self):
         """Handle logout."""
         # Update window for login
-        self.setWindowTitle("Login")
-        self.setMinimumSize(400, 250)
-        self.resize(400, 250)
-        self._center_window()
+        self._apply_window_state("Login", self._LOGIN_SIZE, self._LOGIN_SIZE)
         
         # Switch views - show login
-        self.stacked_widget.setCurrentIndex(self.login_index)
+        self.stacked_widget.setCurrentWidget(self.login_view)
         self.current_user_id = None
+        self._logged_in = False
+        if self.vehicles_controller:
+            self.vehicles_controller.shutdown()
+        self._set_session_shortcuts_enabled(False)
         self.login_view.clear_fields()
 
 
@@ -770,11 +767,21 @@ def main():
     # Suppress macOS IMK warning messages
     os.environ['QT_LOGGING_RULES'] = '*.debug=false'
     
+    # Scaling policy must be set before the QApplication is created
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    
     app = QApplication(sys.argv)
     
     # Set application properties
     app.setApplicationName("GUI Application")
     app.setOrganizationName("GUI App")
+    # Combo boxes and tooltips open instantly instead of running animation timers
+    app.setEffectEnabled(Qt.UIEffect.UI_AnimateCombo, False)
+    app.setEffectEnabled(Qt.UIEffect.UI_AnimateTooltip, False)
+    # Parse the theme once for every window and dialog
+    apply_application_theme(app)
     
     # Create and show main window
     window = Application()
@@ -1,8 +1,9 @@
 """API key model for storing external service credentials."""
-import sqlite3
 from typing import Optional, List, Dict, Tuple
 import os
 
+from models.database import open_connection
+
 
 class ApiKey:
     """API key model with database operations."""
@@ -11,8 +12,15 @@ class ApiKey:
         """Initialize API key model with database path."""
         self.db_path = db_path
         self._ensure_db_directory()
+        # One connection for the model's lifetime; "with self._conn" still
+        # commits (or rolls back) each method's work as a unit
+        self._conn = open_connection(self.db_path)
         self._init_database()
     
+    def close(self) -> None:
+        """Close the model's database connection."""
+        self._conn.close()
+    
     def _ensure_db_directory(self) -> None:
         """Ensure the database directory exists."""
         db_dir = os.path.dirname(self.db_path)
@@ -21,7 +29,7 @@ class ApiKey:
     
     def _init_database(self) -> None:
         """Initialize the database with api_keys table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS api_keys (
@@ -51,7 +59,7 @@ class ApiKey:
             return False, "API key cannot be empty"
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO api_keys (user_id, service_name, api_key)
@@ -75,7 +83,7 @@ class ApiKey:
             The API key or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT api_key FROM api_keys WHERE user_id = ? AND service_name = ?",
@@ -97,7 +105,7 @@ class ApiKey:
             Dictionary of service_name -> api_key
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT service_name, api_key FROM api_keys WHERE user_id = ?",
@@ -119,7 +127,7 @@ class ApiKey:
             Tuple of (success: bool, message: str)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM api_keys WHERE user_id = ? AND service_name = ?",
@@ -1,8 +1,9 @@
 """Customer model for customer management."""
-import sqlite3
 from typing import Optional, Tuple, List, Dict
 import os
 
+from models.database import open_connection
+
 
 class Customer:
     """Customer model with database operations."""
@@ -11,8 +12,15 @@ class Customer:
         """Initialize customer model with database path."""
         self.db_path = db_path
         self._ensure_db_directory()
+        # One connection for the model's lifetime; "with self._conn" still
+        # commits (or rolls back) each method's work as a unit
+        self._conn = open_connection(self.db_path)
         self._init_database()
     
+    def close(self) -> None:
+        """Close the model's database connection."""
+        self._conn.close()
+    
     def _ensure_db_directory(self) -> None:
         """Ensure the database directory exists."""
         db_dir = os.path.dirname(self.db_path)
@@ -21,7 +29,7 @@ class Customer:
     
     def _init_database(self) -> None:
         """Initialize the database with customers table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS customers (
@@ -75,28 +83,69 @@ class Customer:
         postcode = postcode.strip() if postcode else ""
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
-                # Calculate the next user_customer_id for this user
-                cursor.execute("""
-                    SELECT COALESCE(MAX(user_customer_id), 0) + 1 
-                    FROM customers 
-                    WHERE user_id = ?
-                """, (user_id,))
-                next_user_customer_id = cursor.fetchone()[0]
-                
+                # The next user_customer_id for this user is worked out inside the
+                # INSERT, so no other connection can take the same number in between
                 cursor.execute(
                     """INSERT INTO customers 
                        (name, phone, house_name_no, street_address, city, county, postcode, user_id, user_customer_id) 
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (name, phone, house_name_no, street_address, city, county, postcode, user_id, next_user_customer_id)
+                       SELECT ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(MAX(user_customer_id), 0) + 1
+                       FROM customers 
+                       WHERE user_id = ?""",
+                    (name, phone, house_name_no, street_address, city, county, postcode, user_id, user_id)
                 )
+                cursor.execute(
+                    "SELECT user_customer_id FROM customers WHERE id = ?", (cursor.lastrowid,)
+                )
+                next_user_customer_id = cursor.fetchone()[0]
                 conn.commit()
                 return True, f"Customer created successfully (ID: {next_user_customer_id})"
         except Exception as e:
             return False, f"Error creating customer: {str(e)}"
     
+    def create_many(self, customers: List[Tuple[str, str, str, str, str, str, str]],
+                    user_id: int) -> Tuple[bool, str]:
+        """
+        Create several customers in a single transaction.
+        
+        Every customer is validated first; if any is invalid nothing is saved.
+        Customers are numbered in list order after the user's existing ones.
+        
+        Args:
+            customers: (name, phone, house_name_no, street_address, city, county,
+                postcode) tuples
+            user_id: ID of the user creating the customers
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not user_id:
+            return False, "User ID is required"
+        
+        rows = []
+        for row_number, (name, *details) in enumerate(customers, start=1):
+            if not name or not name.strip():
+                return False, f"Customer {row_number}: Name is required"
+            details = [value.strip() if value else "" for value in details]
+            rows.append((name.strip(), *details, user_id, user_id))
+        
+        try:
+            with self._conn as conn:
+                # Same numbering INSERT as create(); each row sees the ones before it
+                conn.executemany(
+                    """INSERT INTO customers 
+                       (name, phone, house_name_no, street_address, city, county, postcode, user_id, user_customer_id) 
+                       SELECT ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(MAX(user_customer_id), 0) + 1
+                       FROM customers 
+                       WHERE user_id = ?""",
+                    rows
+                )
+            return True, f"{len(rows)} customers created successfully"
+        except Exception as e:
+            return False, f"Error creating customers: {str(e)}"
+    
     def get_all(self, user_id: int) -> List[Dict[str, any]]:
         """
         Get all customers for a specific user.
@@ -108,8 +157,7 @@ class Customer:
             List of customer dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT 
@@ -144,8 +192,7 @@ class Customer:
             Customer dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT 
@@ -199,7 +246,7 @@ class Customer:
         postcode = postcode.strip() if postcode else ""
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """UPDATE customers 
@@ -233,8 +280,7 @@ class Customer:
             List of matching customer dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
                 # Build query based on provided search terms
@@ -289,7 +335,7 @@ class Customer:
             Tuple of (success: bool, message: str)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM customers WHERE user_customer_id = ? AND user_id = ?", 
@@ -299,20 +345,23 @@ class Customer:
                 if cursor.rowcount == 0:
                     return False, "Customer not found"
                 
-                # Recalculate user_customer_id for remaining customers
+                # Recalculate user_customer_id for remaining customers (1..n in
+                # id order); only rows whose number changes are rewritten, in
+                # one batched statement
                 cursor.execute("""
-                    SELECT id FROM customers 
-                    WHERE user_id = ? 
+                    SELECT row_number, id FROM (
+                        SELECT id, user_customer_id,
+                               ROW_NUMBER() OVER (ORDER BY id) AS row_number
+                        FROM customers 
+                        WHERE user_id = ?
+                    )
+                    WHERE row_number != user_customer_id
                     ORDER BY id
                 """, (user_id,))
-                remaining_ids = [row[0] for row in cursor.fetchall()]
-                
-                for index, internal_id in enumerate(remaining_ids, start=1):
-                    cursor.execute("""
-                        UPDATE customers 
-                        SET user_customer_id = ? 
-                        WHERE id = ? AND user_id = ?
-                    """, (index, internal_id, user_id))
+                cursor.executemany(
+                    "UPDATE customers SET user_customer_id = ? WHERE id = ?",
+                    cursor.fetchall()
+                )
                 
                 conn.commit()
                 return True, "Customer deleted successfully"
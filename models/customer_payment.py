@@ -1,8 +1,9 @@
 """Customer payment model for customer payment management."""
-import sqlite3
 from typing import Optional, Tuple, List, Dict
 import os
 
+from models.database import open_connection
+
 
 class CustomerPayment:
     """Customer payment model with database operations."""
@@ -11,8 +12,15 @@ class CustomerPayment:
         """Initialize customer payment model with database path."""
         self.db_path = db_path
         self._ensure_db_directory()
+        # One connection for the model's lifetime; "with self._conn" still
+        # commits (or rolls back) each method's work as a unit
+        self._conn = open_connection(self.db_path, timeout=10.0)
         self._init_database()
     
+    def close(self) -> None:
+        """Close the model's database connection."""
+        self._conn.close()
+    
     def _ensure_db_directory(self):
         """Ensure the database directory exists."""
         db_dir = os.path.dirname(self.db_path)
@@ -21,7 +29,7 @@ class CustomerPayment:
     
     def _init_database(self):
         """Initialize the database with customer_payments table."""
-        with sqlite3.connect(self.db_path, timeout=10.0) as conn:
+        with self._conn as conn:
             cursor = conn.cursor()
             
             # Check if table exists
@@ -48,8 +56,37 @@ class CustomerPayment:
                     )
                 """)
             
+            # Indexes matching get_all's filters and ordering, so payment lists
+            # are read in order instead of scanned and sorted
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_customer_payments_user_date
+                ON customer_payments (user_id, payment_date DESC, id DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_customer_payments_user_customer_date
+                ON customer_payments (user_id, customer_id, payment_date DESC, id DESC)
+            """)
+            
             conn.commit()
     
+    @staticmethod
+    def _validate(customer_id: int, payment_date: str, amount: float,
+                  payment_method: str, user_id: int) -> Optional[str]:
+        """Return why a payment can't be created, or None if it is valid."""
+        if not payment_date:
+            return "Payment date is required"
+        
+        if amount <= 0:
+            return "Payment amount must be greater than zero"
+        
+        if not user_id or not customer_id:
+            return "User ID and customer ID are required"
+        
+        if payment_method not in ['Cash', 'Card', 'Cheque', 'BACS']:
+            return "Payment method must be one of: Cash, Card, Cheque, BACS"
+        
+        return None
+    
     def create(self, customer_id: int, payment_date: str, amount: float,
                reference: str, payment_method: str, user_id: int) -> Tuple[bool, str, Optional[int]]:
         """
@@ -66,22 +103,14 @@ class CustomerPayment:
         Returns:
             Tuple of (success: bool, message: str, payment_id: Optional[int])
         """
-        if not payment_date:
-            return False, "Payment date is required", None
-        
-        if amount <= 0:
-            return False, "Payment amount must be greater than zero", None
-        
-        if not user_id or not customer_id:
-            return False, "User ID and customer ID are required", None
-        
-        if payment_method not in ['Cash', 'Card', 'Cheque', 'BACS']:
-            return False, "Payment method must be one of: Cash, Card, Cheque, BACS", None
+        error = self._validate(customer_id, payment_date, amount, payment_method, user_id)
+        if error:
+            return False, error, None
         
         reference = reference.strip() if reference else ""
         
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -95,6 +124,40 @@ class CustomerPayment:
         except Exception as e:
             return False, f"Error creating payment: {str(e)}", None
     
+    def create_many(self, payments: List[Tuple[int, str, float, str, str]],
+                    user_id: int) -> Tuple[bool, str]:
+        """
+        Create several customer payments in a single transaction.
+        
+        Every payment is validated first; if any is invalid nothing is saved.
+        
+        Args:
+            payments: (customer_id, payment_date, amount, reference, payment_method)
+                tuples, with the same rules as create()
+            user_id: ID of the user creating the payments
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        rows = []
+        for row_number, (customer_id, payment_date, amount, reference, payment_method) \
+                in enumerate(payments, start=1):
+            error = self._validate(customer_id, payment_date, amount, payment_method, user_id)
+            if error:
+                return False, f"Payment {row_number}: {error}"
+            reference = reference.strip() if reference else ""
+            rows.append((user_id, customer_id, payment_date, amount, reference, payment_method))
+        
+        try:
+            with self._conn as conn:
+                conn.executemany("""
+                    INSERT INTO customer_payments (user_id, customer_id, payment_date, amount, reference, payment_method)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+            return True, f"{len(rows)} payments created successfully"
+        except Exception as e:
+            return False, f"Error creating payments: {str(e)}"
+    
     def get_all(self, user_id: int, customer_id: Optional[int] = None) -> List[Dict[str, any]]:
         """
         Get all customer payments for a user, optionally filtered by customer.
@@ -107,8 +170,7 @@ class CustomerPayment:
             List of payment dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
                 if customer_id:
@@ -143,8 +205,7 @@ class CustomerPayment:
             Payment dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT id, customer_id, payment_date, amount, reference, payment_method, created_at
@@ -167,26 +228,24 @@ class CustomerPayment:
             Unallocated amount
         """
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
-                # Get payment amount
-                cursor.execute("SELECT amount FROM customer_payments WHERE id = ?", (payment_id,))
+                # Payment amount less everything allocated from it, in one query
+                cursor.execute("""
+                    SELECT p.amount - COALESCE((
+                        SELECT SUM(a.amount_allocated)
+                        FROM customer_payment_allocations a
+                        WHERE a.payment_id = p.id
+                    ), 0.0)
+                    FROM customer_payments p
+                    WHERE p.id = ?
+                """, (payment_id,))
                 result = cursor.fetchone()
                 if not result:
                     return 0.0
                 
-                payment_amount = result[0]
-                
-                # Sum allocated amounts
-                cursor.execute("""
-                    SELECT COALESCE(SUM(amount_allocated), 0.0)
-                    FROM customer_payment_allocations
-                    WHERE payment_id = ?
-                """, (payment_id,))
-                allocated = cursor.fetchone()[0]
-                
-                return max(0.0, payment_amount - allocated)
+                return max(0.0, result[0])
         except Exception:
             return 0.0
     
@@ -202,7 +261,7 @@ class CustomerPayment:
             Tuple of (success: bool, message: str)
         """
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
                 # Check if payment exists and belongs to user
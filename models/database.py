@@ -0,0 +1,31 @@
+"""Shared setup for models that keep a long-lived SQLite connection."""
+import sqlite3
+
+
+# Applied once per connection. WAL lets reads carry on while another
+# connection commits, and in WAL mode synchronous=NORMAL only syncs on
+# checkpoints rather than on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def open_connection(db_path: str, timeout: float = 5.0) -> sqlite3.Connection:
+    """
+    Open a tuned connection that returns sqlite3.Row rows.
+
+    Args:
+        db_path: Path to the database file
+        timeout: Seconds to wait for another connection's lock
+
+    Returns:
+        The open connection
+    """
+    conn = sqlite3.connect(db_path, timeout=timeout)
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
@@ -3,6 +3,7 @@ import sqlite3
 from typing import Optional, Tuple, List, Dict
 import os
 from datetime import datetime
+from utils.vat import get_vat_rate
 
 
 class Invoice:
@@ -259,13 +260,9 @@ class Invoice:
                 subtotal = 0.0
                 vat_amount = 0.0
                 
-                # VAT rates by code: S=Standard (20%), E=Exempt (0%), Z=Zero (0%)
-                vat_rates = {'S': 20.0, 'E': 0.0, 'Z': 0.0}
-                
                 for line_total, vat_code in items:
                     subtotal += line_total
-                    vat_code = (vat_code or 'S').strip().upper()
-                    vat_rate = vat_rates.get(vat_code, 20.0)  # Default to 20% if unknown
+                    vat_rate = get_vat_rate(vat_code)  # Default to 20% if unknown
                     line_vat = line_total * (vat_rate / 100.0)
                     vat_amount += line_vat
                 
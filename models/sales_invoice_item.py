@@ -2,6 +2,7 @@
 import sqlite3
 from typing import Optional, Tuple, List, Dict
 import os
+from utils.vat import VAT_RATES, DEFAULT_VAT_CODE, normalize_vat_code
 
 
 class SalesInvoiceItem:
@@ -90,9 +91,9 @@ class SalesInvoiceItem:
             with sqlite3.connect(self.db_path, timeout=10.0) as conn:
                 cursor = conn.cursor()
                 
-                vat_code = vat_code.strip().upper() if vat_code else 'S'
-                if vat_code not in ['S', 'E', 'Z']:
-                    vat_code = 'S'  # Default to Standard if invalid
+                vat_code = normalize_vat_code(vat_code)
+                if vat_code not in VAT_RATES:
+                    vat_code = DEFAULT_VAT_CODE  # Default to Standard if invalid
                 
                 cursor.execute("""
                     INSERT INTO sales_invoice_items (sales_invoice_id, product_id, service_id, stock_number, 
@@ -220,6 +220,37 @@ class Supplier:
         except Exception:
             return None
     
+    def get_by_account_number(self, account_number: str, user_id: int) -> Optional[Dict[str, any]]:
+        """
+        Get a supplier by account number for a specific user.
+        
+        Args:
+            account_number: Supplier account number (unique per user)
+            user_id: ID of the user
+        
+        Returns:
+            Supplier dictionary or None if not found
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    id as internal_id,
+                    COALESCE(user_supplier_id, id) as id,
+                    account_number, 
+                    name, 
+                    created_at 
+                FROM suppliers 
+                WHERE account_number = ? AND user_id = ?
+            """, (account_number.strip(), user_id))
+            row = cursor.fetchone()
+            conn.close()
+            return dict(row) if row else None
+        except Exception:
+            return None
+    
     def update(self, supplier_id: int, account_number: str, name: str, user_id: int) -> Tuple[bool, str]:
         """
         Update a supplier by user_supplier_id.
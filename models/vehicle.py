@@ -210,19 +210,7 @@ class Vehicle:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT DISTINCT c.id as internal_id, c.user_customer_id as id,
-                           c.name, c.phone, c.house_name_no, c.street_address,
-                           c.city, c.county, c.postcode, c.created_at
-                    FROM sales_invoices si
-                    JOIN customers c ON si.customer_id = c.id
-                    WHERE si.vehicle_id = ? AND si.user_id = ?
-                    ORDER BY si.document_date DESC, si.created_at DESC
-                    LIMIT 1
-                """, (vehicle_id, user_id))
-                row = cursor.fetchone()
-                return dict(row) if row else None
+                return self._fetch_customer_for_vehicle(conn.cursor(), user_id, vehicle_id)
         except Exception:
             return None
     
@@ -240,19 +228,75 @@ class Vehicle:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT id, customer_id, vehicle_id, document_number, document_date,
-                           document_type, notes, subtotal, vat_amount, total, status,
-                           created_at, updated_at
-                    FROM sales_invoices
-                    WHERE vehicle_id = ? AND user_id = ?
-                    ORDER BY document_date DESC, document_number DESC
-                """, (vehicle_id, user_id))
-                return [dict(row) for row in cursor.fetchall()]
+                return self._fetch_sales_history_for_vehicle(conn.cursor(), user_id, vehicle_id)
         except Exception:
             return []
     
+    def get_vehicle_with_context(
+        self, user_id: int, vehicle_id: int
+    ) -> Tuple[bool, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get a vehicle together with its customer and sales history on one connection.
+        
+        Args:
+            user_id: The user ID
+            vehicle_id: The vehicle ID
+        
+        Returns:
+            Tuple of (success, message, vehicle, customer, sales_history)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM vehicles WHERE user_id = ? AND id = ?",
+                    (user_id, vehicle_id)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return False, "Vehicle not found", None, None, []
+                return (
+                    True,
+                    "",
+                    self._row_to_dict(row),
+                    self._fetch_customer_for_vehicle(cursor, user_id, vehicle_id),
+                    self._fetch_sales_history_for_vehicle(cursor, user_id, vehicle_id),
+                )
+        except Exception as e:
+            return False, f"Failed to load vehicle: {str(e)}", None, None, []
+    
+    def _fetch_customer_for_vehicle(
+        self, cursor: sqlite3.Cursor, user_id: int, vehicle_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the most recent invoiced customer for a vehicle using an open cursor."""
+        cursor.execute("""
+            SELECT DISTINCT c.id as internal_id, c.user_customer_id as id,
+                   c.name, c.phone, c.house_name_no, c.street_address,
+                   c.city, c.county, c.postcode, c.created_at
+            FROM sales_invoices si
+            JOIN customers c ON si.customer_id = c.id
+            WHERE si.vehicle_id = ? AND si.user_id = ?
+            ORDER BY si.document_date DESC, si.created_at DESC
+            LIMIT 1
+        """, (vehicle_id, user_id))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def _fetch_sales_history_for_vehicle(
+        self, cursor: sqlite3.Cursor, user_id: int, vehicle_id: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch sales invoices for a vehicle using an open cursor."""
+        cursor.execute("""
+            SELECT id, customer_id, vehicle_id, document_number, document_date,
+                   document_type, notes, subtotal, vat_amount, total, status,
+                   created_at, updated_at
+            FROM sales_invoices
+            WHERE vehicle_id = ? AND user_id = ?
+            ORDER BY document_date DESC, document_number DESC
+        """, (vehicle_id, user_id))
+        return [dict(row) for row in cursor.fetchall()]
+    
     def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         """Convert a database row to a dictionary."""
         data = dict(row)
@@ -0,0 +1,16 @@
+"""Helpers for tests that scan the application source."""
+import os
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIRS = ("controllers", "views", "models", "utils")
+
+
+def source_files():
+    """Yield every application Python source file."""
+    yield os.path.join(PROJECT_ROOT, "main.py")
+    for directory in SOURCE_DIRS:
+        for dirpath, _dirnames, filenames in os.walk(os.path.join(PROJECT_ROOT, directory)):
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    yield os.path.join(dirpath, filename)
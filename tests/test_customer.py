@@ -0,0 +1,181 @@
+"""Tests for Customer model."""
+import unittest
+import os
+import tempfile
+from models.customer import Customer
+from models.user import User
+
+
+class TestCustomer(unittest.TestCase):
+    """Test cases for Customer model."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create a temporary database for each test
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.customer_model = Customer(db_path=self.temp_db.name)
+        self.user_model = User(db_path=self.temp_db.name)
+        
+        # Create a test user
+        self.user_model.create_user("testuser", "password123")
+        # Get user_id
+        success, _, user_id = self.user_model.authenticate("testuser", "password123")
+        self.assertTrue(success)
+        self.user_id = user_id
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.customer_model.close()
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+    
+    def _create(self, name: str):
+        """Create a customer with only a name."""
+        return self.customer_model.create(name, "", "", "", "", "", "", self.user_id)
+    
+    def test_create_customer_success(self):
+        """Test successful customer creation."""
+        success, message = self._create("Test Customer")
+        self.assertTrue(success)
+        self.assertIn("(ID: 1)", message)
+    
+    def test_create_customer_numbers_per_user(self):
+        """Test each user's customers are numbered from 1 and continue after deletes."""
+        self.user_model.create_user("otheruser", "password123")
+        _, _, other_user_id = self.user_model.authenticate("otheruser", "password123")
+        self._create("Customer 1")
+        self._create("Customer 2")
+        
+        success, message = self.customer_model.create(
+            "Other Customer", "", "", "", "", "", "", other_user_id
+        )
+        self.assertTrue(success)
+        self.assertIn("(ID: 1)", message)
+        
+        self.customer_model.delete(1, self.user_id)
+        success, message = self._create("Customer 3")
+        self.assertTrue(success)
+        self.assertIn("(ID: 2)", message)
+    
+    def test_create_many_customers(self):
+        """Test bulk creation numbers customers after the existing ones."""
+        self._create("Existing")
+        success, message = self.customer_model.create_many(
+            [
+                (" Bulk 1 ", "0123", "", "", "", "", ""),
+                ("Bulk 2", None, "", "", "", "", " AB1 2CD "),
+            ],
+            self.user_id
+        )
+        self.assertTrue(success)
+        self.assertIn("2 customers", message)
+        
+        customers = self.customer_model.get_all(self.user_id)
+        self.assertEqual(
+            [(c['id'], c['name']) for c in customers],
+            [(1, "Existing"), (2, "Bulk 1"), (3, "Bulk 2")]
+        )
+        self.assertEqual(customers[2]['postcode'], "AB1 2CD")
+    
+    def test_create_many_customers_invalid_row_saves_nothing(self):
+        """Test a bulk creation with an invalid row creates no customers."""
+        success, message = self.customer_model.create_many(
+            [("Bulk 1", "", "", "", "", "", ""), ("", "", "", "", "", "", "")],
+            self.user_id
+        )
+        self.assertFalse(success)
+        self.assertIn("Customer 2", message)
+        self.assertEqual(self.customer_model.get_all(self.user_id), [])
+    
+    def test_create_customer_empty_name(self):
+        """Test creating customer with empty name."""
+        success, message = self._create("  ")
+        self.assertFalse(success)
+        self.assertIn("required", message)
+    
+    def test_get_all_customers(self):
+        """Test getting all customers."""
+        # Initially empty
+        self.assertEqual(self.customer_model.get_all(self.user_id), [])
+        
+        self._create("Customer 1")
+        self._create("Customer 2")
+        
+        customers = self.customer_model.get_all(self.user_id)
+        self.assertEqual([c['id'] for c in customers], [1, 2])
+        self.assertEqual(customers[0]['name'], "Customer 1")
+    
+    def test_update_customer(self):
+        """Test updating a customer is visible to later reads."""
+        self._create("Old Name")
+        success, _ = self.customer_model.update(
+            1, "New Name", "0123", "", "", "", "", "", self.user_id
+        )
+        self.assertTrue(success)
+        
+        customer = self.customer_model.get_by_id(1, self.user_id)
+        self.assertEqual(customer['name'], "New Name")
+        self.assertEqual(customer['phone'], "0123")
+    
+    def test_update_customer_not_found(self):
+        """Test updating non-existent customer."""
+        success, message = self.customer_model.update(
+            999, "Name", "", "", "", "", "", "", self.user_id
+        )
+        self.assertFalse(success)
+        self.assertIn("not found", message)
+    
+    def test_changes_visible_to_other_connections(self):
+        """Test that writes are committed for other models' connections."""
+        self._create("Shared Customer")
+        other_model = Customer(db_path=self.temp_db.name)
+        try:
+            customers = other_model.get_all(self.user_id)
+        finally:
+            other_model.close()
+        self.assertEqual(len(customers), 1)
+    
+    def test_delete_customer_renumbers_remaining(self):
+        """Test deleting a customer renumbers the remaining customers."""
+        for name in ("Customer 1", "Customer 2", "Customer 3"):
+            self._create(name)
+        
+        success, message = self.customer_model.delete(1, self.user_id)
+        self.assertTrue(success)
+        self.assertIn("deleted successfully", message)
+        
+        customers = self.customer_model.get_all(self.user_id)
+        self.assertEqual(
+            [(c['id'], c['name']) for c in customers],
+            [(1, "Customer 2"), (2, "Customer 3")]
+        )
+    
+    def test_delete_customer_leaves_other_users_alone(self):
+        """Test renumbering after a delete only touches the deleting user's customers."""
+        self.user_model.create_user("otheruser", "password123")
+        _, _, other_user_id = self.user_model.authenticate("otheruser", "password123")
+        for name in ("Customer 1", "Customer 2", "Customer 3"):
+            self._create(name)
+            self.customer_model.create(name, "", "", "", "", "", "", other_user_id)
+        
+        success, _ = self.customer_model.delete(2, self.user_id)
+        self.assertTrue(success)
+        
+        customers = self.customer_model.get_all(self.user_id)
+        self.assertEqual(
+            [(c['id'], c['name']) for c in customers],
+            [(1, "Customer 1"), (2, "Customer 3")]
+        )
+        other_customers = self.customer_model.get_all(other_user_id)
+        self.assertEqual([c['id'] for c in other_customers], [1, 2, 3])
+    
+    def test_delete_customer_not_found(self):
+        """Test deleting non-existent customer."""
+        success, message = self.customer_model.delete(999, self.user_id)
+        self.assertFalse(success)
+        self.assertIn("not found", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for CustomerPayment model."""
+import unittest
+import os
+import tempfile
+from models.customer_payment import CustomerPayment
+from models.customer_payment_allocation import CustomerPaymentAllocation
+
+
+class TestCustomerPayment(unittest.TestCase):
+    """Test cases for CustomerPayment model."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create a temporary database for each test
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.payment_model = CustomerPayment(db_path=self.temp_db.name)
+        # Creates the allocations table used by get_unallocated_amount
+        CustomerPaymentAllocation(db_path=self.temp_db.name)
+        self.user_id = 1
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.payment_model.close()
+        if os.path.exists(self.temp_db.name):
+            os.unlink(self.temp_db.name)
+    
+    def _allocate(self, payment_id: int, sales_invoice_id: int, amount: float):
+        """Insert an allocation row directly."""
+        with self.payment_model._conn as conn:
+            conn.execute(
+                """INSERT INTO customer_payment_allocations
+                   (payment_id, sales_invoice_id, amount_allocated) VALUES (?, ?, ?)""",
+                (payment_id, sales_invoice_id, amount)
+            )
+    
+    def test_create_payment_success(self):
+        """Test successful payment creation."""
+        success, message, payment_id = self.payment_model.create(
+            1, "2024-01-01", 50.0, "REF", "Card", self.user_id
+        )
+        self.assertTrue(success)
+        self.assertIn("£50.00", message)
+        
+        payment = self.payment_model.get_by_id(payment_id, self.user_id)
+        self.assertEqual(payment['reference'], "REF")
+        self.assertEqual(payment['payment_method'], "Card")
+    
+    def test_create_many_payments(self):
+        """Test bulk creation saves every payment."""
+        success, message = self.payment_model.create_many(
+            [
+                (1, "2024-01-01", 10.0, " A ", "Cash"),
+                (2, "2024-01-02", 20.0, None, "BACS"),
+            ],
+            self.user_id
+        )
+        self.assertTrue(success)
+        self.assertIn("2 payments", message)
+        
+        payments = self.payment_model.get_all(self.user_id)
+        self.assertEqual(
+            [(p['customer_id'], p['amount'], p['reference']) for p in payments],
+            [(2, 20.0, ""), (1, 10.0, "A")]
+        )
+    
+    def test_create_many_payments_invalid_row_saves_nothing(self):
+        """Test a bulk creation with an invalid payment saves none of them."""
+        success, message = self.payment_model.create_many(
+            [(1, "2024-01-01", 10.0, "", "Cash"), (1, "2024-01-02", 5.0, "", "Bitcoin")],
+            self.user_id
+        )
+        self.assertFalse(success)
+        self.assertIn("Payment 2", message)
+        self.assertEqual(self.payment_model.get_all(self.user_id), [])
+    
+    def test_get_all_orders_newest_first(self):
+        """Test payments are listed by payment date, newest first."""
+        self.payment_model.create(1, "2024-01-01", 10.0, "", "Cash", self.user_id)
+        self.payment_model.create(2, "2024-03-01", 20.0, "", "Cash", self.user_id)
+        self.payment_model.create(1, "2024-02-01", 30.0, "", "Cash", self.user_id)
+        
+        payments = self.payment_model.get_all(self.user_id)
+        self.assertEqual([p['amount'] for p in payments], [20.0, 30.0, 10.0])
+        
+        payments = self.payment_model.get_all(self.user_id, customer_id=1)
+        self.assertEqual([p['amount'] for p in payments], [30.0, 10.0])
+    
+    def test_unallocated_amount(self):
+        """Test unallocated amount is the payment less its allocations."""
+        _, _, payment_id = self.payment_model.create(
+            1, "2024-01-01", 100.0, "", "Cash", self.user_id
+        )
+        self.assertEqual(self.payment_model.get_unallocated_amount(payment_id), 100.0)
+        
+        self._allocate(payment_id, 1, 30.0)
+        self._allocate(payment_id, 2, 20.0)
+        self.assertEqual(self.payment_model.get_unallocated_amount(payment_id), 50.0)
+    
+    def test_unallocated_amount_never_negative(self):
+        """Test over-allocated payments report zero."""
+        _, _, payment_id = self.payment_model.create(
+            1, "2024-01-01", 10.0, "", "Cash", self.user_id
+        )
+        self._allocate(payment_id, 1, 15.0)
+        self.assertEqual(self.payment_model.get_unallocated_amount(payment_id), 0.0)
+    
+    def test_unallocated_amount_payment_not_found(self):
+        """Test a missing payment has nothing unallocated."""
+        self.assertEqual(self.payment_model.get_unallocated_amount(999), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
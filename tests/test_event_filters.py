@@ -0,0 +1,24 @@
+"""Tests that no Python event filters are installed for routing input."""
+import os
+import unittest
+from tests.source_files import PROJECT_ROOT, source_files
+
+
+class TestEventFilters(unittest.TestCase):
+    """Test cases for event filter usage."""
+
+    def test_no_event_filters(self):
+        """Test that installEventFilter is not used anywhere in the application."""
+        # A Python event filter runs for every event delivered to the watched object,
+        # so navigation belongs in QShortcut objects or key event handlers instead.
+        offenders = []
+        for path in source_files():
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if "installEventFilter(" in line:
+                        offenders.append(f"{os.path.relpath(path, PROJECT_ROOT)}:{line_number}")
+        self.assertEqual(offenders, [], "Python event filters installed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""Tests that signals and slots are declared with normalized (type-object) signatures."""
+import os
+import re
+import unittest
+from tests.source_files import PROJECT_ROOT, source_files
+
+
+# String-form declarations make Qt try a lookup with the raw signature and then
+# normalize it; type objects (Signal(int), Slot(str)) are already normalized.
+STRING_SIGNATURE = re.compile(r"""\b(?:Signal|Slot|SIGNAL|SLOT)\(\s*["']|\.connect\(\s*["']""")
+
+
+class TestSignalSignatures(unittest.TestCase):
+    """Test cases for signal/slot declarations."""
+
+    def test_no_string_signatures(self):
+        """Test that no Signal/Slot/connect uses a string signature."""
+        offenders = []
+        for path in source_files():
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if STRING_SIGNATURE.search(line):
+                        offenders.append(f"{os.path.relpath(path, PROJECT_ROOT)}:{line_number}")
+        self.assertEqual(offenders, [], "String-form signal/slot signatures found")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,8 +14,9 @@ class TestSupplier(unittest.TestCase):
         # Create a temporary database for each test
         self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
         self.temp_db.close()
-        self.supplier_model = Supplier(db_path=self.temp_db.name)
+        # Users first - the suppliers migration reads the users table
         self.user_model = User(db_path=self.temp_db.name)
+        self.supplier_model = Supplier(db_path=self.temp_db.name)
         
         # Create a test user
         self.user_model.create_user("testuser", "password123")
@@ -83,6 +84,37 @@ class TestSupplier(unittest.TestCase):
         supplier = self.supplier_model.get_by_id(999, self.user_id)
         self.assertIsNone(supplier)
     
+    def test_get_supplier_by_account_number(self):
+        """Test getting supplier by account number."""
+        self.supplier_model.create("ACC001", "Test Supplier", self.user_id)
+        supplier_id = self.supplier_model.get_all(self.user_id)[0]['id']
+        
+        supplier = self.supplier_model.get_by_account_number("ACC001", self.user_id)
+        self.assertIsNotNone(supplier)
+        self.assertEqual(supplier['id'], supplier_id)
+        self.assertEqual(supplier['account_number'], "ACC001")
+        self.assertEqual(supplier['name'], "Test Supplier")
+    
+    def test_get_supplier_by_account_number_not_found(self):
+        """Test getting supplier by a non-existent account number."""
+        self.supplier_model.create("ACC001", "Test Supplier", self.user_id)
+        supplier = self.supplier_model.get_by_account_number("ACC999", self.user_id)
+        self.assertIsNone(supplier)
+    
+    def test_get_supplier_by_account_number_other_user(self):
+        """Test that account number lookups only return the user's own supplier."""
+        self.user_model.create_user("otheruser", "password123")
+        _, _, other_user_id = self.user_model.authenticate("otheruser", "password123")
+        self.supplier_model.create("ACC001", "Test Supplier", self.user_id)
+        
+        self.assertIsNone(self.supplier_model.get_by_account_number("ACC001", other_user_id))
+        
+        self.supplier_model.create("ACC001", "Other Supplier", other_user_id)
+        supplier = self.supplier_model.get_by_account_number("ACC001", self.user_id)
+        other_supplier = self.supplier_model.get_by_account_number("ACC001", other_user_id)
+        self.assertEqual(supplier['name'], "Test Supplier")
+        self.assertEqual(other_supplier['name'], "Other Supplier")
+    
     def test_update_supplier_success(self):
         """Test successful supplier update."""
         self.supplier_model.create("ACC001", "Old Name", self.user_id)
@@ -0,0 +1,65 @@
+"""Tests for the throttled method decorator."""
+import unittest
+from unittest.mock import patch
+from utils.throttle import throttled
+
+
+class _Handler:
+    """Records every call that gets through the throttle."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    @throttled(0.25)
+    def handle(self, key):
+        """Record the call and return its argument."""
+        self.calls.append(key)
+        return key
+
+
+class TestThrottled(unittest.TestCase):
+    """Test cases for throttled."""
+    
+    def setUp(self):
+        """Set up a controllable clock."""
+        self.now = 100.0
+        patcher = patch("utils.throttle.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.handler = _Handler()
+    
+    def test_repeat_call_within_interval_is_dropped(self):
+        """Test that a repeat call inside the interval does not run."""
+        self.assertEqual(self.handler.handle("sales"), "sales")
+        self.now += 0.1
+        self.assertIsNone(self.handler.handle("sales"))
+        self.assertEqual(self.handler.calls, ["sales"])
+    
+    def test_different_arguments_are_throttled_separately(self):
+        """Test that a call with different arguments still runs."""
+        self.handler.handle("sales")
+        self.now += 0.1
+        self.handler.handle("customers")
+        self.assertEqual(self.handler.calls, ["sales", "customers"])
+    
+    def test_instances_are_throttled_separately(self):
+        """Test that a call on another instance still runs."""
+        other_handler = _Handler()
+        self.handler.handle("sales")
+        self.now += 0.1
+        other_handler.handle("sales")
+        self.assertEqual(self.handler.calls, ["sales"])
+        self.assertEqual(other_handler.calls, ["sales"])
+    
+    def test_call_after_interval_runs_again(self):
+        """Test that a call after the interval has passed runs again."""
+        self.handler.handle("sales")
+        self.now += 0.1
+        self.handler.handle("sales")
+        self.now += 0.2
+        self.handler.handle("sales")
+        self.assertEqual(self.handler.calls, ["sales", "sales"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 """Centralized style constants and utilities."""
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
+from PySide6.QtWidgets import QApplication
+
 
 class AppStyles:
     """Centralized application styles."""
@@ -69,10 +72,13 @@ class AppStyles:
         return AppStyles.label_style(size, color=AppStyles.COLOR_PLACEHOLDER)
 
 
+@lru_cache(maxsize=1)
 def load_theme_stylesheet() -> str:
     """
     Load the Windows XP theme stylesheet from file.
     
+    The file is read once per process; every window and dialog reuses the same text.
+    
     Returns:
         The stylesheet content as a string, or empty string if file not found
     """
@@ -91,7 +97,28 @@ def apply_theme(widget) -> None:
         widget: The widget to apply the theme to
     """
     stylesheet = load_theme_stylesheet()
+    if not stylesheet:
+        return
+    # Widgets already inherit the theme once it is set application-wide (see
+    # apply_application_theme); re-setting it would make Qt parse it again
+    app = QApplication.instance()
+    if app is not None and app.styleSheet() == stylesheet:
+        return
+    widget.setStyleSheet(stylesheet)
+
+
+def apply_application_theme(app: QApplication) -> None:
+    """
+    Apply the Windows XP theme once to the whole application.
+    
+    Every window and dialog inherits it, so later apply_theme() calls
+    become no-ops.
+    
+    Args:
+        app: The running QApplication
+    """
+    stylesheet = load_theme_stylesheet()
     if stylesheet:
-        widget.setStyleSheet(stylesheet)
+        app.setStyleSheet(stylesheet)
 
 
@@ -0,0 +1,35 @@
+"""Leading-edge call throttling for keyboard-driven handlers."""
+import time
+from functools import wraps
+
+
+def throttled(interval: float):
+    """
+    Decorate a method so repeat calls within an interval are dropped.
+
+    The first call runs immediately; further calls with the same arguments
+    are ignored until ``interval`` seconds have passed. This keeps key
+    auto-repeat from running an expensive handler many times a second.
+
+    Args:
+        interval: Minimum number of seconds between runs
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method):
+        attr_name = f"_throttle_{method.__name__}"
+
+        @wraps(method)
+        def wrapper(self, *args):
+            # Last run time per argument tuple, stored on the instance
+            last_runs = self.__dict__.setdefault(attr_name, {})
+            now = time.monotonic()
+            if now - last_runs.get(args, float("-inf")) < interval:
+                return None
+            last_runs[args] = now
+            return method(self, *args)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,40 @@
+"""VAT code constants and helpers shared by invoice models and controllers."""
+from typing import Optional
+
+# VAT rates by code: S=Standard (20%), E=Exempt (0%), Z=Zero (0%)
+VAT_RATES = {'S': 20.0, 'E': 0.0, 'Z': 0.0}
+DEFAULT_VAT_CODE = 'S'
+
+
+def normalize_vat_code(vat_code: Optional[str]) -> str:
+    """
+    Normalize a VAT code to its canonical upper-case form.
+
+    Codes that are already canonical (the common case for values read back
+    from the database) are returned as-is without building new strings.
+
+    Args:
+        vat_code: Raw VAT code (may be None, padded or lower-case)
+
+    Returns:
+        Normalized VAT code (unknown codes are returned normalized but unvalidated)
+    """
+    if vat_code in VAT_RATES:
+        return vat_code
+    return (vat_code or DEFAULT_VAT_CODE).strip().upper()
+
+
+def get_vat_rate(vat_code: Optional[str]) -> float:
+    """
+    Get the VAT rate percentage for a VAT code.
+
+    Args:
+        vat_code: VAT code (S, E, or Z)
+
+    Returns:
+        VAT rate as a percentage (defaults to the standard rate if unknown)
+    """
+    rate = VAT_RATES.get(vat_code)
+    if rate is None:
+        rate = VAT_RATES.get(normalize_vat_code(vat_code), VAT_RATES[DEFAULT_VAT_CODE])
+    return rate
@@ -233,6 +233,9 @@ class NavigationPanel(QFrame):
         Args:
             view_name: The current view name (dashboard, suppliers, products, inventory, configuration)
         """
+        # The highlight is already applied when the panel is created
+        if view_name == self.current_view:
+            return
         self.current_view = view_name
         self._update_highlighting()
     
@@ -253,10 +256,12 @@ class NavigationPanel(QFrame):
         }
         
         for view_name, button in buttons.items():
-            if view_name == self.current_view:
-                button.setProperty("active", "true")
-            else:
-                button.setProperty("active", "false")
+            active = "true" if view_name == self.current_view else "false"
+            # Only buttons whose state changed need restyling; repolishing
+            # re-resolves the whole stylesheet for the button
+            if button.property("active") == active:
+                continue
+            button.setProperty("active", active)
             # Force style update by unpolishing and repolishing
             style = button.style()
             if style:
@@ -105,6 +105,10 @@ class SuppliersView(BaseTabbedView):
         self.product_model = product_model
         self.tyre_model = tyre_model
     
+    def set_user_id(self, user_id: int):
+        """Update the current user ID without re-binding controllers."""
+        self._current_user_id = user_id
+    
     def _create_widgets(self):
         """Create and layout UI widgets."""
         # Add action buttons using base class method
@@ -1086,25 +1090,9 @@ class SuppliersView(BaseTabbedView):
         self.suppliers_table.setRowCount(len(filtered_suppliers))
         
         for row, supplier in enumerate(filtered_suppliers):
-            self.suppliers_table.setItem(row, 0, QTableWidgetItem(str(supplier['id'])))
-            self.suppliers_table.setItem(row, 1, QTableWidgetItem(supplier['account_number']))
-            self.suppliers_table.setItem(row, 2, QTableWidgetItem(supplier['name']))
-            
-            # Calculate outstanding balance
-            if self.supplier_model and hasattr(self, '_current_user_id'):
-                outstanding = self.supplier_model.get_outstanding_balance(supplier['id'], 
-                                                                         self._current_user_id)
-                self.suppliers_table.setItem(row, 3, QTableWidgetItem(f"£{outstanding:.2f}"))
-            else:
-                self.suppliers_table.setItem(row, 3, QTableWidgetItem("£0.00"))
+            self._set_supplier_row(row, supplier)
         
-        # Distribute columns proportionally based on content
-        TableConfig.distribute_columns_proportionally(self.suppliers_table)
-        header = self.suppliers_table.horizontalHeader()
-        header.resizeSection(0, 80)
-        if len(filtered_suppliers) > 0:
-            header.resizeSection(1, 200)
-            header.resizeSection(3, 150)
+        self._resize_supplier_columns()
         
         # Auto-select first row and set focus to table if data exists
         if len(filtered_suppliers) > 0:
@@ -1115,6 +1103,59 @@ class SuppliersView(BaseTabbedView):
             # Trigger selection changed to update details tab
             self._on_supplier_selection_changed()
     
+    def _set_supplier_row(self, row: int, supplier: Dict[str, any]):
+        """Fill one suppliers table row, including the outstanding balance."""
+        self.suppliers_table.setItem(row, 0, QTableWidgetItem(str(supplier['id'])))
+        self.suppliers_table.setItem(row, 1, QTableWidgetItem(supplier['account_number']))
+        self.suppliers_table.setItem(row, 2, QTableWidgetItem(supplier['name']))
+        
+        # Calculate outstanding balance
+        if self.supplier_model and hasattr(self, '_current_user_id'):
+            outstanding = self.supplier_model.get_outstanding_balance(supplier['id'], 
+                                                                     self._current_user_id)
+            self.suppliers_table.setItem(row, 3, QTableWidgetItem(f"£{outstanding:.2f}"))
+        else:
+            self.suppliers_table.setItem(row, 3, QTableWidgetItem("£0.00"))
+    
+    def _resize_supplier_columns(self):
+        """Distribute suppliers table columns proportionally based on content."""
+        TableConfig.distribute_columns_proportionally(self.suppliers_table)
+        header = self.suppliers_table.horizontalHeader()
+        header.resizeSection(0, 80)
+        if self.suppliers_table.rowCount() > 0:
+            header.resizeSection(1, 200)
+            header.resizeSection(3, 150)
+    
+    def insert_supplier_row(self, supplier: Dict[str, any]):
+        """Add a newly created supplier to the table without reloading every row."""
+        self._all_suppliers_data = self._all_suppliers_data + [supplier]
+        if self.suppliers_search_box.text().strip():
+            # The new row may not match the active search - let the filter decide
+            self._filter_suppliers()
+            return
+        row = self.suppliers_table.rowCount()
+        self.suppliers_table.insertRow(row)
+        self._set_supplier_row(row, supplier)
+        self._resize_supplier_columns()
+    
+    def update_supplier_row(self, supplier: Dict[str, any]):
+        """Replace an edited supplier's row without reloading every row."""
+        self._all_suppliers_data = [
+            supplier if s['id'] == supplier['id'] else s for s in self._all_suppliers_data
+        ]
+        if not self.suppliers_search_box.text().strip():
+            supplier_id = str(supplier['id'])
+            for row in range(self.suppliers_table.rowCount()):
+                item = self.suppliers_table.item(row, 0)
+                if item and item.text() == supplier_id:
+                    self._set_supplier_row(row, supplier)
+                    self._resize_supplier_columns()
+                    if self.suppliers_table.currentRow() == row:
+                        self._on_supplier_selection_changed()
+                    return
+        # Filtered (or row not shown) - the edit may change which rows match
+        self._filter_suppliers()
+    
     def load_invoices(self, invoices: List[Dict[str, any]]):
         """Load invoices into the invoices table."""
         self.invoices_table.setRowCount(len(invoices))
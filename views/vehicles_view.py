@@ -507,6 +507,10 @@ class VehiclesView(BaseTabbedView):
         # Switch to details tab
         self.tab_widget.setCurrentIndex(1)
     
+    def set_lookup_busy(self, busy: bool) -> None:
+        """Disable the API lookup button while a lookup is in progress."""
+        self.api_lookup_btn.setEnabled(not busy)
+    
     def clear_vrm_input(self) -> None:
         """Clear the VRM input field."""
         self.vrm_input.clear()